@@ -0,0 +1,2 @@
+# Presente só para que o pytest ponha a raiz do repositório no sys.path:
+# os testes em tests/ importam o pacote grafos sem instalá-lo.
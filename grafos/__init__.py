@@ -0,0 +1,57 @@
+# Algoritmos em grafos
+# Os submódulos só são importados no primeiro acesso (grafos.bfs.bfs(G, v),
+# grafos.Grafo, ...), então "import grafos" é barato e não carrega NumPy.
+# Os exemplos de cada módulo rodam com python -m grafos.<modulo>, e o
+# executor de tarefas em lote com python -m grafos (ver __main__.py).
+
+from importlib import import_module
+
+_MODULOS = (
+    "alg_fleury",
+    "apsp_dinamico",
+    "bellman_ford",
+    "bellmore_nemhauser",
+    "benchmark",
+    "bfs",
+    "caixeiro",
+    "conectividade",
+    "dfs",
+    "dijkstra",
+    "euleriano",
+    "execucao_lote",
+    "floyd_warshall",
+    "geradores",
+    "grafo_csr",
+    "grafo_utils",
+    "held_karp",
+    "instrumentacao",
+    "io_grafos",
+    "johnson",
+    "oraculo",
+)
+
+# classes/funções expostas direto no pacote -> módulo que as define
+_NOMES = {
+    "Grafo": "grafo_utils",
+    "GrafoCSR": "grafo_csr",
+    "ler_lista_arestas": "io_grafos",
+    "salvar_lista_arestas": "io_grafos",
+    "salvar_snapshot": "io_grafos",
+    "carregar_snapshot": "io_grafos",
+}
+
+__all__ = list(_MODULOS) + list(_NOMES)
+
+
+def __getattr__(nome):
+    if nome in _MODULOS:
+        return import_module(f".{nome}", __name__)
+    if nome in _NOMES:
+        valor = getattr(import_module(f".{_NOMES[nome]}", __name__), nome)
+        globals()[nome] = valor  # próximos acessos não passam mais por aqui
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,221 @@
+# Executor de tarefas em lote:
+#     python -m grafos GRAFO TAREFAS [--nao-direcionado] [--ponderado] [--saida arquivo]
+# GRAFO é um snapshot (diretório gravado por io_grafos.salvar_snapshot), uma
+# lista de arestas .csv/.tsv/.txt ou um .json com as chaves "vertices",
+# "arestas", "direcionado" e "ponderado".
+# TAREFAS tem uma tarefa JSON por linha ("-" lê da entrada padrão):
+#     {"algoritmo": "bfs", "origem": 1}
+#     {"algoritmo": "bellman_ford", "origens": [1, 2, 3]}
+#     {"algoritmo": "dijkstra", "origem": "a", "destino": "b", "id": "consulta-7"}
+# O grafo é carregado uma única vez (os caches do Grafo valem para todas as
+# tarefas) e cada execução vira uma linha JSON na saída assim que termina.
+# Com --estatisticas cada linha traz também os contadores e tempos por fase
+# coletados por instrumentacao.coletar (ver instrumentacao.py).
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from importlib import import_module
+
+
+def _par(a, b):
+    return lambda r: {a: r[0], b: r[1]}
+
+
+# algoritmo -> (módulo, função, parâmetro que recebe "origem", formatação do resultado)
+ALGORITMOS = {
+    "bfs": ("bfs", "bfs", "no_fonte", _par("dist", "pai")),
+    "alcancavel": ("bfs", "alcancavel", "origem", None),
+    "dfs": ("dfs", "dfs", "no_init",
+            lambda r: {"descoberta": r[0], "finalizacao": r[1], "pai": r[2], "ciclos": r[3]}),
+    "bellman_ford": ("bellman_ford", "bellman_ford", "origem", _par("dist", "pai")),
+    "bellman_ford_vetorizado": ("bellman_ford", "bellman_ford_vetorizado", "origem", _par("dist", "pai")),
+    "spfa": ("bellman_ford", "spfa", "origem", _par("dist", "pai")),
+    "encontrar_ciclo_negativo": ("bellman_ford", "encontrar_ciclo_negativo", "origem", None),
+    "dijkstra": ("dijkstra", "dijkstra", "origem", _par("dist", "pai")),
+    "caminho_minimo": ("dijkstra", "caminho_minimo", "origem", _par("dist", "pai")),
+    "floyd_warshall": ("floyd_warshall", "floyd_warshall", None, _par("dist", "pai")),
+    "componentes_conexas": ("conectividade", "componentes_conexas", None, None),
+    "componentes_fortemente_conexas": ("conectividade", "componentes_fortemente_conexas", None, None),
+    "pontes": ("conectividade", "pontes", None, None),
+    "tipo_euleriano": ("euleriano", "tipo_euleriano", None, None),
+    "caminho_euleriano": ("euleriano", "caminho_euleriano", "inicio", None),
+    "alg_fleury": ("alg_fleury", "alg_fleury", None, None),
+    "bellmore_nemhauser": ("bellmore_nemhauser", "bellmore_nemhauser", None, None),
+    "rota_heuristica": ("caixeiro", "rota_heuristica", None, _par("ciclo", "custo")),
+    "rota_otima": ("held_karp", "rota_otima", None, _par("ciclo", "custo")),
+}
+
+_CHAVES_RESERVADAS = {"algoritmo", "origem", "origens", "id"}
+
+
+# -------------------- entrada --------------------
+def carregar_grafo(caminho, direcionado=True, ponderado=False, labels_inteiros=False, separador=None,
+                   cabecalho=False):
+    """
+    Lê o grafo de caminho (snapshot, lista de arestas ou .json) como Grafo.
+    """
+    from .grafo_utils import Grafo
+    from . import io_grafos
+
+    if os.path.isdir(caminho):
+        return io_grafos.carregar_snapshot(caminho).para_grafo()
+    if caminho.endswith(".json"):
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+        ponderado = dados.get("ponderado", False)
+        arestas = [tuple(a) for a in dados["arestas"]]
+        return Grafo(dados["vertices"], arestas, dados.get("direcionado", True), ponderado)
+    csr = io_grafos.ler_lista_arestas(caminho, direcionado, ponderado, separador,
+                                      cabecalho=cabecalho, labels_inteiros=labels_inteiros)
+    return csr.para_grafo()
+
+
+def ler_tarefas(arquivo):
+    """
+    Itera sobre as tarefas (dicts) de um arquivo JSON lines, ignorando linhas
+    vazias e as iniciadas por #.
+    """
+    for numero, linha in enumerate(arquivo, 1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+        try:
+            tarefa = json.loads(linha)
+        except json.JSONDecodeError as erro:
+            raise ValueError(f"Linha {numero} do arquivo de tarefas não é JSON válido: {erro}")
+        if not isinstance(tarefa, dict) or "algoritmo" not in tarefa:
+            raise ValueError(f"Linha {numero}: tarefa deve ser um objeto com a chave \"algoritmo\"")
+        yield tarefa
+
+
+def _label(G, valor):
+    """
+    Labels vindos do JSON: aceita "7" para o vértice 7 e vice-versa.
+    """
+    if G.verificar_vertice(valor):
+        return valor
+    for conversao in (int, str):
+        try:
+            convertido = conversao(valor)
+        except (TypeError, ValueError):
+            continue
+        if G.verificar_vertice(convertido):
+            return convertido
+    raise ValueError(f"Vértice {valor!r} não existe")
+
+
+# -------------------- saída --------------------
+def para_json(obj):
+    """
+    Converte resultados para tipos JSON: dicts com chave tupla viram listas
+    [u, v, valor], inf/nan viram null e arrays NumPy viram listas.
+    """
+    if hasattr(obj, "tolist"):
+        obj = obj.tolist()
+    if isinstance(obj, dict):
+        if obj and all(isinstance(k, tuple) for k in obj):
+            return [[*map(para_json, k), para_json(v)] for k, v in obj.items()]
+        return {str(k): para_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return [para_json(x) for x in obj]
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+# -------------------- execução --------------------
+def executar(G, tarefas, estatisticas=False):
+    """
+    Gera um dict por execução: uma por tarefa, ou uma por item de "origens".
+    Erros de uma tarefa viram {"erro": ...} sem interromper as demais.
+    estatisticas=True acrescenta a chave "estatisticas" (contadores, fases).
+    """
+    from contextlib import nullcontext
+    from .instrumentacao import coletar
+
+    for indice, tarefa in enumerate(tarefas):
+        nome = tarefa["algoritmo"]
+        ident = tarefa.get("id", indice)
+        if nome not in ALGORITMOS:
+            yield {"id": ident, "algoritmo": nome, "erro": f"Algoritmo desconhecido: {nome}"}
+            continue
+        modulo, funcao, parametro_origem, formatar = ALGORITMOS[nome]
+        extras = {k: v for k, v in tarefa.items() if k not in _CHAVES_RESERVADAS}
+
+        if "origens" in tarefa:
+            origens = tarefa["origens"]
+        elif "origem" in tarefa:
+            origens = [tarefa["origem"]]
+        else:
+            origens = [None]
+
+        for origem in origens:
+            linha = {"id": ident, "algoritmo": nome}
+            if origem is not None:
+                linha["origem"] = origem
+            coleta = coletar() if estatisticas else nullcontext()
+            est = None
+            inicio = time.perf_counter()
+            try:
+                algoritmo = getattr(import_module(f".{modulo}", __package__), funcao)
+                argumentos = dict(extras)
+                if "destino" in argumentos:
+                    argumentos["destino"] = _label(G, argumentos["destino"])
+                if origem is not None:
+                    if parametro_origem is None:
+                        raise ValueError(f"{nome} não recebe origem")
+                    argumentos[parametro_origem] = _label(G, origem)
+                with coleta as est:
+                    resultado = algoritmo(G, **argumentos)
+                linha["resultado"] = para_json(formatar(resultado) if formatar else resultado)
+            except Exception as erro:
+                linha["erro"] = f"{type(erro).__name__}: {erro}"
+            linha["tempo"] = time.perf_counter() - inicio
+            if est is not None:
+                linha["estatisticas"] = est.como_dict()
+            yield linha
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m grafos",
+                                     description="Executa um lote de algoritmos sobre um grafo")
+    parser.add_argument("grafo", nargs="?", help="snapshot, lista de arestas (.csv/.tsv/.txt) ou .json")
+    parser.add_argument("tarefas", nargs="?", help='arquivo JSON lines com as tarefas ("-" para stdin)')
+    parser.add_argument("--nao-direcionado", action="store_true", help="lista de arestas não direcionada")
+    parser.add_argument("--ponderado", action="store_true", help="lista de arestas com coluna de peso")
+    parser.add_argument("--labels-inteiros", action="store_true", help="converte labels da lista para int")
+    parser.add_argument("--separador", help="separador da lista de arestas")
+    parser.add_argument("--cabecalho", action="store_true", help="ignora a primeira linha da lista de arestas")
+    parser.add_argument("--saida", help="arquivo de saída (padrão: saída padrão)")
+    parser.add_argument("--estatisticas", action="store_true",
+                        help="inclui contadores e tempos por fase de cada execução")
+    parser.add_argument("--listar", action="store_true", help="só lista os algoritmos disponíveis")
+    args = parser.parse_args(argv)
+
+    if args.listar:
+        print("\n".join(sorted(ALGORITMOS)))
+        return
+    if args.grafo is None or args.tarefas is None:
+        parser.error("informe o grafo e o arquivo de tarefas")
+
+    G = carregar_grafo(args.grafo, not args.nao_direcionado, args.ponderado,
+                       args.labels_inteiros, args.separador, args.cabecalho)
+    entrada = sys.stdin if args.tarefas == "-" else open(args.tarefas, encoding="utf-8")
+    saida = open(args.saida, "w", encoding="utf-8") if args.saida else sys.stdout
+    try:
+        for linha in executar(G, ler_tarefas(entrada), args.estatisticas):
+            saida.write(json.dumps(linha, ensure_ascii=False) + "\n")
+            saida.flush()
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+from .grafo_utils import Grafo
+from .conectividade import _pontes
+from .instrumentacao import contar, fase
+
+
+def alg_fleury(G: Grafo):
+    """
+    Fleury para grafo não direcionado, partindo de G.vertices[0] e visitando
+    os vizinhos em ordem crescente de índice.
+    Uma aresta é segura quando não é ponte das arestas restantes e todos os
+    vértices ainda não fechados continuam na componente do vértice atual.
+    As pontes são recalculadas (Tarjan, O(V + E)) só na componente atual.
+    """
+    if G.direcionado:
+        raise ValueError("Fleury requer grafo não direcionado")
+
+    resposta = []
+
+    with fase("alg_fleury.conexidade"):
+        if not G.conexo_por_mm():
+            raise Exception("Grafo não é conexo")
+
+    idx = {v: i for i, v in enumerate(G.vertices)}
+    adj = [set() for _ in G.vertices]
+    for (u, v) in G._iter_arcos():
+        adj[idx[u]].add(idx[v])
+    restantes = sum(len(vizinhos) for vizinhos in adj)
+
+    current_node = G.vertices[0]
+    index_node = 0
+    vertices_fechados = set()
+
+    testes_de_ponte = 0
+    while True:
+        # Verifica se todas as arestas foram removidas
+        if restantes == 0:
+            contar("alg_fleury.arestas_percorridas", len(resposta))
+            contar("alg_fleury.testes_de_ponte", testes_de_ponte)
+            return resposta
+
+        vizinhos = sorted(adj[index_node])
+        if not vizinhos:
+            raise ValueError("Não há aresta saindo do vértice atual: grafo não é euleriano")
+
+        # Se é a única aresta do vértice, deve ser usada
+        if len(vizinhos) == 1:
+            restantes -= remover_aresta(adj, index_node, vizinhos[0])
+            resposta, current_node, index_node, vertices_fechados = \
+                processar_aresta_unica(resposta, current_node, index_node, vizinhos[0], vertices_fechados, G)
+            continue
+
+        # Testa se a aresta é uma ponte
+        segura = None
+        testes_de_ponte += 1
+        with fase("alg_fleury.pontes"):
+            pontes, componente = _pontes(adj, [index_node])
+        if len(componente) == len(G.vertices) - len(vertices_fechados):
+            segura = next((i for i in vizinhos
+                           if (min(index_node, i), max(index_node, i)) not in pontes), None)
+
+        # Se nenhuma aresta segura foi encontrada, pega qualquer uma
+        if segura is None:
+            segura = vizinhos[0]
+        restantes -= remover_aresta(adj, index_node, segura)
+        resposta, current_node, index_node = \
+            processar_aresta_segura(resposta, current_node, segura, G)
+
+
+def remover_aresta(adj, index_node, i):
+    """
+    Remove a aresta {index_node, i}; retorna quantas entradas de adjacência saíram.
+    """
+    adj[index_node].discard(i)
+    if i == index_node:
+        return 1
+    adj[i].discard(index_node)
+    return 2
+
+
+def processar_aresta_unica(resposta, current_node, index_node, i, vertices_fechados, G):
+    vertices_fechados.add(index_node)
+    resposta.append((current_node, G.vertices[i]))
+    current_node = G.vertices[i]
+    index_node = i
+    return resposta, current_node, index_node, vertices_fechados
+
+
+def processar_aresta_segura(resposta, current_node, i, G):
+    resposta.append((current_node, G.vertices[i]))
+    current_node = G.vertices[i]
+    index_node = i
+    return resposta, current_node, index_node
+
+
+if __name__ == "__main__":
+    # Teste do algoritmo de Fleury
+    g = Grafo(
+        vertices=[1, 2, 3, 4, 5, 6, 7, 8, 9],
+        direcionado=False,
+        arestas=[
+            (1, 2), (1, 5),
+            (2, 3), (2, 5), (2, 4),
+            (3, 6),
+            (4, 5), (4, 8), (4, 7),
+            (5, 6), (5, 9), (5, 8),
+            (7, 8),
+            (8, 9)
+        ]
+    )
+    print(alg_fleury(g))
@@ -0,0 +1,142 @@
+# Caminhos mínimos entre todos os pares mantidos enquanto o grafo cresce.
+# APSPDinamico calcula (D, P) uma vez com floyd_warshall_matricial e se
+# registra como observador do Grafo. Cada arco u -> v inserido (ou com peso
+# reduzido para w) atualiza as matrizes em O(V²), numa única operação NumPy
+# sobre todas as linhas:
+#     D[a, b] = min(D[a, b], D[a, u] + w + D[v, b])
+# O novo caminho usa o arco no máximo uma vez (sem ciclos negativos), então
+# uma passada basta. Aumentar o peso de um arco que está em algum caminho
+# mínimo, adicionar_arestas ou mudanças manuais só marcam as matrizes como
+# desatualizadas; o Floyd-Warshall completo roda de novo no próximo acesso.
+# O grafo guarda só uma referência fraca ao APSPDinamico, que é coletado
+# normalmente quando descartado (com as matrizes O(V²)), mesmo sem fechar().
+#     apsp = APSPDinamico(G)
+#     G.adicionar_aresta("a", "b", 2)
+#     apsp.distancia("a", "c"), apsp.caminho("a", "c")
+
+import numpy as np
+
+from .grafo_utils import Grafo
+from .floyd_warshall import floyd_warshall_matricial, reconstruir_caminho
+from .instrumentacao import ativo, contar
+
+
+class APSPDinamico:
+    def __init__(self, grafo: Grafo):
+        """
+        Calcula as matrizes iniciais (ValueError se há ciclo negativo) e passa
+        a acompanhar adicionar_vertice/adicionar_aresta/adicionar_arestas.
+        """
+        self.grafo = grafo
+        self._recalcular()
+        grafo.registrar_observador(self._grafo_modificado, fraco=True)
+
+    def fechar(self):
+        """
+        Deixa de observar o grafo; as matrizes ficam como estão.
+        """
+        self.grafo.remover_observador(self._grafo_modificado)
+
+    # -------------------- manutenção --------------------
+    def _recalcular(self):
+        self._D, self._P = floyd_warshall_matricial(self.grafo)
+        self.vertices = list(self.grafo.csr().vertices)
+        self._indice = {v: i for i, v in enumerate(self.vertices)}
+        self._alocar_auxiliares()
+        self._desatualizado = False
+        contar("apsp_dinamico.recalculos")
+
+    def _alocar_auxiliares(self):
+        n = len(self.vertices)
+        self._candidato = np.empty((n, n))
+        self._melhor = np.empty((n, n), dtype=bool)
+
+    def _grafo_modificado(self, evento, u, v, peso, anterior):
+        if self._desatualizado:
+            return
+        if evento == "arco":
+            i, j = self._indice[u], self._indice[v]
+            if anterior is None or peso < anterior:
+                self._relaxar_arco(i, j, peso)
+            elif peso > anterior and self._D[i, j] >= anterior:
+                # o arco era um caminho mínimo de u a v (e talvez de outros
+                # pares): distâncias podem aumentar, o que não é incremental
+                self._desatualizado = True
+        elif evento == "vertice":
+            self._adicionar_vertice(u)
+        else:
+            self._desatualizado = True
+
+    def _relaxar_arco(self, i, j, w):
+        """
+        Atualiza D e P para o arco i -> j de peso w, em O(V²).
+        """
+        D, P = self._D, self._P
+        if w >= D[i, j]:
+            return  # já existe caminho de i a j tão curto quanto o arco
+        if D[j, i] + w < 0:
+            self._desatualizado = True  # o recálculo acusa o ciclo negativo
+            return
+        candidato, melhor = self._candidato, self._melhor
+        np.add(D[:, i, None], D[None, j, :] + w, out=candidato)
+        np.less(candidato, D, out=melhor)
+        # nos pares melhorados, o caminho de a a b passa a ser
+        # (a ~> i) -> j ~> b: o predecessor de b é o do caminho de j a b
+        predecessores = P[j].copy()
+        predecessores[j] = i
+        np.copyto(P, predecessores, where=melhor)
+        np.minimum(D, candidato, out=D)
+        contar("apsp_dinamico.atualizacoes")
+        if ativo():
+            contar("apsp_dinamico.pares_melhorados", int(np.count_nonzero(melhor)))
+
+    def _adicionar_vertice(self, v):
+        n = len(self.vertices)
+        D = np.full((n + 1, n + 1), np.inf)
+        D[:n, :n] = self._D
+        D[n, n] = 0
+        P = np.full((n + 1, n + 1), -1, dtype=self._P.dtype)
+        P[:n, :n] = self._P
+        self._D, self._P = D, P
+        self.vertices.append(v)
+        self._indice[v] = n
+        self._alocar_auxiliares()
+
+    # -------------------- consultas --------------------
+    def matrizes(self):
+        """
+        Retorna (D, P) atualizadas, no formato de floyd_warshall_matricial
+        (índices na ordem de self.vertices). São as matrizes internas: não as
+        modifique.
+        """
+        if self._desatualizado:
+            self._recalcular()
+        return self._D, self._P
+
+    def distancia(self, origem, destino):
+        D, _ = self.matrizes()
+        if origem not in self._indice or destino not in self._indice:
+            raise ValueError("Vértices não existem")
+        return D[self._indice[origem], self._indice[destino]].item()
+
+    def caminho(self, origem, destino):
+        """
+        Caminho mínimo de origem a destino como lista de labels ([] se
+        destino é inalcançável).
+        """
+        _, P = self.matrizes()
+        if origem not in self._indice or destino not in self._indice:
+            raise ValueError("Vértices não existem")
+        return reconstruir_caminho(P, self.vertices, origem, destino)
+
+
+if __name__ == "__main__":
+    G = Grafo(vertices=["a", "b", "c", "d"],
+              arestas=[("a", "b", 4), ("b", "c", 3), ("c", "d", 2)],
+              direcionado=True, ponderado=True)
+    apsp = APSPDinamico(G)
+    print("d(a, d) =", apsp.distancia("a", "d"), apsp.caminho("a", "d"))
+    G.adicionar_aresta("a", "c", 1)
+    print("Após (a, c, 1): d(a, d) =", apsp.distancia("a", "d"), apsp.caminho("a", "d"))
+    G.adicionar_aresta("a", "c", 9)
+    print("Após (a, c, 9): d(a, d) =", apsp.distancia("a", "d"), apsp.caminho("a", "d"))
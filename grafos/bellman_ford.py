@@ -0,0 +1,218 @@
+from collections import deque
+
+from .grafo_utils import Grafo
+from .instrumentacao import contar, fase
+
+def bellman_ford(grafo: Grafo, origem):
+    dist = {v: float("inf") for v in grafo.vertices}
+    pai = {v: None for v in grafo.vertices}
+    dist[origem] = 0
+
+    arestas = list(grafo._iter_arcos_pesos())
+
+    passadas = 0
+    relaxacoes = 0
+    with fase("bellman_ford.relaxacao"):
+        for _ in range(len(grafo.vertices) - 1):
+            passadas += 1
+            atualizado = False
+            for (u, v, w) in arestas:
+                if dist[u] + w < dist[v]:
+                    dist[v] = dist[u] + w
+                    pai[v] = u
+                    atualizado = True
+                    relaxacoes += 1
+            if not atualizado:
+                break
+    contar("bellman_ford.passadas", passadas)
+    contar("bellman_ford.relaxacoes", relaxacoes)
+    contar("bellman_ford.arestas_examinadas", (passadas + 1) * len(arestas))
+
+    with fase("bellman_ford.verificacao_ciclo"):
+        for (u, v, w) in arestas:
+            if dist[u] + w < dist[v]:
+                raise ValueError("Ciclo de peso negativo detectado!")
+
+    return dist, pai
+
+
+# -------------------- versões com arrays --------------------
+def _arrays_arestas(grafo: Grafo):
+    """
+    Arcos do grafo como arrays (origem, destino, peso) sobre índices do CSR.
+    """
+    import numpy as np
+
+    csr = grafo.csr()
+    src = csr.origens().astype(np.int64)
+    dst = csr.indices.astype(np.int64)
+    pesos = csr.pesos.astype(np.float64) if csr.ponderado else np.ones(dst.size)
+    return csr, src, dst, pesos
+
+
+def _para_dicionarios(csr, dist, pai):
+    """
+    Converte (dist, pai) por índice para os dicts de bellman_ford,
+    mantendo distâncias inteiras quando os pesos são inteiros.
+    """
+    labels = csr.vertices
+    inteiro = not csr.ponderado or csr.pesos.dtype.kind in "iu"
+    inf = float("inf")
+    dist_d = {v: (int(d) if inteiro and d != inf else d) for v, d in zip(labels, dist)}
+    pai_d = {v: (labels[p] if p >= 0 else None) for v, p in zip(labels, pai)}
+    return dist_d, pai_d
+
+
+def bellman_ford_vetorizado(grafo: Grafo, origem):
+    """
+    Bellman-Ford em que cada rodada relaxa todos os arcos de uma vez com NumPy
+    (np.minimum.at sobre arrays origem/destino/peso).
+    Retorna (dist, pai) como bellman_ford.
+    """
+    import numpy as np
+
+    csr, src, dst, pesos = _arrays_arestas(grafo)
+    n = csr.num_vertices()
+    dist = np.full(n, np.inf)
+    pai = np.full(n, -1, dtype=np.int64)
+    dist[csr.indice(origem)] = 0
+
+    passadas = 0
+    relaxacoes = 0
+    for _ in range(n - 1):
+        passadas += 1
+        candidato = dist[src] + pesos
+        melhora = np.flatnonzero(candidato < dist[dst])
+        if melhora.size == 0:
+            break
+        relaxacoes += int(melhora.size)
+        novo = dist.copy()
+        np.minimum.at(novo, dst[melhora], candidato[melhora])
+        vencedores = melhora[candidato[melhora] == novo[dst[melhora]]]
+        pai[dst[vencedores]] = src[vencedores]
+        dist = novo
+    contar("bellman_ford_vetorizado.passadas", passadas)
+    contar("bellman_ford_vetorizado.relaxacoes", relaxacoes)
+
+    if np.any(dist[src] + pesos < dist[dst]):
+        raise ValueError("Ciclo de peso negativo detectado!")
+
+    return _para_dicionarios(csr, dist.tolist(), pai.tolist())
+
+
+def _spfa_csr(indptr, indices, pesos, s):
+    """
+    Núcleo do spfa sobre listas CSR. Retorna (dist, pai) como listas por
+    índice; ValueError se um ciclo negativo é alcançável a partir de s.
+    """
+    n = len(indptr) - 1
+    dist = [float("inf")] * n
+    pai = [-1] * n
+    arcos_no_caminho = [0] * n
+    na_fila = [False] * n
+    dist[s] = 0
+    fila = deque([s])
+    na_fila[s] = True
+
+    retiradas = 0
+    relaxacoes = 0
+    while fila:
+        u = fila.popleft()
+        retiradas += 1
+        na_fila[u] = False
+        du = dist[u]
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = indices[pos]
+            nd = du + pesos[pos]
+            if nd < dist[v]:
+                relaxacoes += 1
+                dist[v] = nd
+                pai[v] = u
+                arcos_no_caminho[v] = arcos_no_caminho[u] + 1
+                if arcos_no_caminho[v] >= n:
+                    raise ValueError("Ciclo de peso negativo detectado!")
+                if not na_fila[v]:
+                    na_fila[v] = True
+                    fila.append(v)
+
+    contar("spfa.retiradas_da_fila", retiradas)
+    contar("spfa.relaxacoes", relaxacoes)
+    return dist, pai
+
+
+def spfa(grafo: Grafo, origem):
+    """
+    Bellman-Ford com fila (SPFA): só reexamina arcos que saem de vértices cuja
+    distância mudou. Um caminho mínimo com n arcos indica ciclo negativo.
+    Retorna (dist, pai) como bellman_ford.
+    """
+    csr = grafo.csr()
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    pesos = csr.pesos.tolist() if csr.ponderado else [1] * len(indices)
+    dist, pai = _spfa_csr(indptr, indices, pesos, csr.indice(origem))
+    return _para_dicionarios(csr, dist, pai)
+
+
+def encontrar_ciclo_negativo(grafo: Grafo, origem=None):
+    """
+    Retorna um ciclo de peso negativo como lista de labels [v0, ..., v0],
+    ou None se não houver. Com origem=None procura em todo o grafo;
+    senão, só entre os ciclos alcançáveis a partir de origem.
+    """
+    csr, src, dst, pesos = _arrays_arestas(grafo)
+    n = csr.num_vertices()
+    arcos = list(zip(src.tolist(), dst.tolist(), pesos.tolist()))
+    if origem is None:
+        dist = [0.0] * n
+    else:
+        dist = [float("inf")] * n
+        dist[csr.indice(origem)] = 0.0
+    pai = [-1] * n
+
+    for _ in range(n):
+        x = -1
+        for (u, v, w) in arcos:
+            if dist[u] + w < dist[v]:
+                dist[v] = dist[u] + w
+                pai[v] = u
+                x = v
+        if x == -1:
+            return None
+
+    # x foi relaxado na n-ésima rodada: n passos para trás caem dentro do ciclo
+    for _ in range(n):
+        x = pai[x]
+    ciclo = [x]
+    v = pai[x]
+    while v != x:
+        ciclo.append(v)
+        v = pai[v]
+    ciclo.append(x)
+    ciclo.reverse()
+    return [csr.vertices[i] for i in ciclo]
+
+
+if __name__ == "__main__":
+    g = Grafo(
+        vertices=["A", "B", "C", "D", "E"],
+        arestas=[
+            ("A", "B", 6),
+            ("A", "D", 7),
+            ("B", "C", 5),
+            ("B", "D", 8),
+            ("B", "E", -4),
+            ("C", "B", -2),
+            ("D", "C", -3),
+            ("D", "E", 9),
+            ("E", "A", 2),
+            ("E", "C", 7),
+        ],
+        direcionado=True,
+        ponderado=True,
+    )
+
+    dist, pai = bellman_ford(g, "A")
+
+    print("Distâncias mínimas:", dist)
+    print("Predecessores:", pai)
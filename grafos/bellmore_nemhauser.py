@@ -11,34 +11,37 @@
 # 4. fim enquanto
 # 5. Retornar H como ciclo hamiltoniano aproximado
 
-from grafo_utils import Grafo
+from .grafo_utils import Grafo
+from .instrumentacao import contar
 
 def bellmore_nemhauser(G: Grafo):
     vertices = G.vertices
-    arestas = G.arestas
+    arestas = list(G._iter_arcos_pesos())
     v=vertices[0]
     H = [v]
     while len(H) < len(vertices):
         menor_c = float("inf")
         menor_v = None
-        for a in arestas:
-            mesmo_v = a[0] == v
-            custo_menor = arestas[a] < menor_c
-            v_livre = a[1] not in H
+        for (a0, a1, custo) in arestas:
+            mesmo_v = a0 == v
+            custo_menor = custo < menor_c
+            v_livre = a1 not in H
             if  mesmo_v and  custo_menor and v_livre:
-                menor_c = arestas[a]
-                menor_v = a[1]
+                menor_c = custo
+                menor_v = a1
+        contar("bellmore_nemhauser.arestas_examinadas", len(arestas))
         if v == menor_v:
             return False
         else:
             v = menor_v
             H.append(v)
-    if (H[0],H[-1]) not in arestas:
+    if not G.verificar_aresta((H[0],H[-1])):
         return False
     H.append(H[0])
     return H
 
-g = Grafo(vertices=['a','b','c','d'], direcionado=False, arestas={('a','b'):3, ('a','c'):2, ('a','d'):7,
-                                                                  ('b','c'):5,('b','d'):9, ('c','d'):6})
-print(bellmore_nemhauser(g))
+if __name__ == "__main__":
+    g = Grafo(vertices=['a','b','c','d'], direcionado=False, ponderado=True,
+              arestas={('a','b'):3, ('a','c'):2, ('a','d'):7, ('b','c'):5,('b','d'):9, ('c','d'):6})
+    print(bellmore_nemhauser(g))
         
\ No newline at end of file
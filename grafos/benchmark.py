@@ -0,0 +1,206 @@
+# Benchmark dos algoritmos sobre grafos de geradores.py
+# Cada caso gera o grafo (fora da medição) com semente fixa, roda o algoritmo
+# algumas vezes medindo o tempo com perf_counter e, numa execução separada
+# sob instrumentacao.coletar, o pico de memória (tracemalloc) e os contadores
+# dos algoritmos (arestas examinadas, relaxações, ...). Os caches do Grafo (adjacências, CSR)
+# persistem entre repetições: tempos[0] inclui montá-los, tempo_min não.
+# O resultado sai em JSON para comparar versões:
+#     python -m grafos.benchmark --saida resultado.json
+#     python -m grafos.benchmark --casos bfs dfs --maximo 10000
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from . import geradores
+from .grafo_utils import Grafo
+from .instrumentacao import coletar
+
+
+# -------------------- medição --------------------
+def medir(funcao, repeticoes=3, memoria=True, estatisticas=True):
+    """
+    Executa funcao() repeticoes vezes. Retorna dict com os tempos (s) mínimo,
+    mediano e de cada execução e, numa execução extra instrumentada (que não
+    entra nos tempos), o pico alocado em bytes (memoria=True) e os contadores,
+    tempos por fase e séries dos algoritmos (estatisticas=True).
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    resultado = {
+        "tempo_min": min(tempos),
+        "tempo_mediano": float(np.median(tempos)),
+        "tempos": tempos,
+    }
+    if memoria or estatisticas:
+        with coletar(memoria=memoria) as est:
+            funcao()
+        if memoria:
+            resultado["pico_memoria"] = est.pico_memoria
+        if estatisticas:
+            dados = est.como_dict()
+            dados.pop("pico_memoria", None)
+            resultado["estatisticas"] = dados
+    return resultado
+
+
+# -------------------- casos --------------------
+def _construcao(G):
+    if G.ponderado:
+        arestas = [(u, v, w) for (u, v), w in G.arestas.items()]
+    else:
+        arestas = list(G.arestas)
+    if not G.direcionado and G.espelhar:
+        # G.arestas já tem os dois sentidos e o construtor espelharia de novo:
+        # cada aresta entra uma única vez, como saiu do gerador
+        vistas = set()
+        unicas = []
+        for aresta in arestas:
+            if (aresta[1], aresta[0]) not in vistas:
+                vistas.add((aresta[0], aresta[1]))
+                unicas.append(aresta)
+        arestas = unicas
+    return lambda: Grafo(G.vertices, arestas, G.direcionado, G.ponderado)
+
+
+def _bfs(G):
+    from .bfs import bfs
+    return lambda: bfs(G, G.vertices[0])
+
+
+def _dfs(G):
+    from .dfs import dfs
+    return lambda: dfs(G, G.vertices[0])
+
+
+def _bellman_ford(G):
+    from .bellman_ford import bellman_ford
+    return lambda: bellman_ford(G, G.vertices[0])
+
+
+def _floyd_warshall(G):
+    from .floyd_warshall import floyd_warshall
+    return lambda: floyd_warshall(G)
+
+
+def _alg_fleury(G):
+    from .alg_fleury import alg_fleury
+    return lambda: alg_fleury(G)
+
+
+def _bellmore_nemhauser(G):
+    from .bellmore_nemhauser import bellmore_nemhauser
+    return lambda: bellmore_nemhauser(G)
+
+
+# (nome, preparar(G) -> função medida, gerador(n, semente) -> Grafo, tamanhos)
+CASOS = [
+    ("construcao_er", _construcao,
+     lambda n, s: geradores.erdos_renyi(n, grau_medio=8, semente=s), [1000, 10000, 100000]),
+    ("bfs_er", _bfs,
+     lambda n, s: geradores.erdos_renyi(n, grau_medio=8, semente=s), [1000, 10000, 100000]),
+    ("bfs_grade", _bfs,
+     lambda n, s: geradores.grade(int(n ** 0.5), int(n ** 0.5), semente=s), [1000, 10000, 100000]),
+    ("bfs_livre_de_escala", _bfs,
+     lambda n, s: geradores.livre_de_escala(n, 3, semente=s), [1000, 10000, 100000]),
+    ("dfs_er", _dfs,
+     lambda n, s: geradores.erdos_renyi(n, grau_medio=8, semente=s), [1000, 10000, 100000]),
+    ("dfs_grade", _dfs,
+     lambda n, s: geradores.grade(int(n ** 0.5), int(n ** 0.5), semente=s), [1000, 10000, 100000]),
+    ("bellman_ford_er", _bellman_ford,
+     lambda n, s: geradores.erdos_renyi(n, grau_medio=8, direcionado=True, ponderado=True, semente=s),
+     [100, 1000, 3000]),
+    ("floyd_warshall_completo", _floyd_warshall,
+     lambda n, s: geradores.completo_ponderado(n, semente=s), [50, 200, 500]),
+    ("alg_fleury_euleriano", _alg_fleury,
+     lambda n, s: geradores.euleriano_aleatorio(n, semente=s), [50, 200, 500]),
+    ("bellmore_nemhauser_completo", _bellmore_nemhauser,
+     lambda n, s: geradores.completo_ponderado(n, semente=s), [20, 50, 100]),
+]
+
+
+def executar(casos=None, maximo=None, semente=0, repeticoes=3, memoria=True, progresso=None):
+    """
+    Roda os casos (todos, ou os cujos nomes começam por algum item de casos)
+    nos tamanhos <= maximo. Retorna a lista de resultados.
+    """
+    resultados = []
+    for nome, preparar, gerador, tamanhos in CASOS:
+        if casos and not any(nome.startswith(c) for c in casos):
+            continue
+        for n in tamanhos:
+            if maximo is not None and n > maximo:
+                continue
+            G = gerador(n, semente)
+            medida = medir(preparar(G), repeticoes, memoria)
+            medida.update({
+                "caso": nome,
+                "n": n,
+                "vertices": len(G.vertices),
+                "arcos": G.csr().num_arcos(),
+                "semente": semente,
+            })
+            resultados.append(medida)
+            if progresso:
+                progresso(medida)
+    return resultados
+
+
+def _ambiente():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+    }
+
+
+def _imprimir(medida):
+    memoria = medida.get("pico_memoria")
+    texto = f" {memoria / 2 ** 20:8.2f} MiB" if memoria is not None else ""
+    print(f"{medida['caso']:<30} n={medida['n']:<7} {medida['tempo_min'] * 1000:10.2f} ms{texto}",
+          file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de grafos")
+    parser.add_argument("--casos", nargs="*", help="prefixos dos casos (padrão: todos)")
+    parser.add_argument("--maximo", type=int, help="ignora tamanhos maiores que este")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico com tracemalloc")
+    parser.add_argument("--saida", help="arquivo JSON (padrão: saída padrão)")
+    parser.add_argument("--listar", action="store_true", help="só lista os casos")
+    args = parser.parse_args(argv)
+
+    if args.listar:
+        for nome, _, _, tamanhos in CASOS:
+            print(nome, tamanhos)
+        return
+
+    resultados = executar(args.casos, args.maximo, args.semente, args.repeticoes,
+                          not args.sem_memoria, progresso=_imprimir)
+    relatorio = {"ambiente": _ambiente(), "resultados": resultados}
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+    else:
+        json.dump(relatorio, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
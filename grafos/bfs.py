@@ -0,0 +1,232 @@
+import time
+from collections import deque
+
+from .grafo_utils import Grafo
+from .instrumentacao import ativo, contar
+
+
+def bfs(G: Grafo, no_fonte, rastreio=None):
+    """
+    Busca em largura iterativa (fila deque) a partir de no_fonte.
+    Retorna (d, pi): distância em arestas (inf se inalcançável) e pai na árvore.
+    rastreio: função opcional chamada como rastreio(evento, v, d, pi), com
+    evento em "fonte", "visita", "descoberta" e "finalizacao".
+    """
+    lista_adj = G.lista_adjacencias(ordenada=True)
+    d = {u: float('inf') for u in G.vertices}
+    pi = {u: None for u in G.vertices}
+
+    d[no_fonte] = 0
+    Q = deque([no_fonte])
+    if rastreio:
+        rastreio("fonte", no_fonte, d, pi)
+    while Q:
+        u = Q.popleft()
+        if rastreio:
+            rastreio("visita", u, d, pi)
+        du = d[u] + 1
+        for v in lista_adj[u]:
+            if d[v] == float('inf'):
+                d[v] = du
+                pi[v] = u
+                if rastreio:
+                    rastreio("descoberta", v, d, pi)
+                Q.append(v)
+        if rastreio:
+            rastreio("finalizacao", u, d, pi)
+    if ativo():
+        # cada vértice alcançado tem a lista de adjacência inteira examinada
+        alcancados = [u for u in G.vertices if d[u] != float('inf')]
+        contar("bfs.vertices_visitados", len(alcancados))
+        contar("bfs.arestas_examinadas", sum(len(lista_adj[u]) for u in alcancados))
+    return d, pi
+
+
+def bfs_eventos(G: Grafo, no_fonte):
+    """
+    Versão preguiçosa da busca em largura: gera eventos (evento, u, v) sob demanda,
+    permitindo parar a qualquer momento:
+      ("descoberta", u, v)  -> v descoberto pela aresta de árvore (u, v); u=None na fonte
+      ("finalizacao", None, v) -> todos os vizinhos de v foram examinados
+    Além da lista de adjacências do próprio grafo (sem ordenar), guarda só a
+    fila e o conjunto de visitados: os vizinhos de cada vértice são ordenados
+    quando ele é expandido.
+    """
+    lista_adj = G.lista_adjacencias()
+    visitados = {no_fonte}
+    Q = deque([no_fonte])
+    yield ("descoberta", None, no_fonte)
+    while Q:
+        u = Q.popleft()
+        for v in sorted(lista_adj[u]):
+            if v not in visitados:
+                visitados.add(v)
+                Q.append(v)
+                yield ("descoberta", u, v)
+        yield ("finalizacao", None, u)
+
+
+def alcancavel(G: Grafo, origem, destino):
+    """
+    Diz se destino é alcançável a partir de origem, parando assim que o encontra.
+    """
+    for evento, _, v in bfs_eventos(G, origem):
+        if evento == "descoberta" and v == destino:
+            return True
+    return False
+
+
+# -------------------- BFS por níveis (NumPy sobre CSR) --------------------
+def _expandir(indptr, indices, vertices):
+    """
+    Concatena indices[indptr[v]:indptr[v+1]] para todos os v dados.
+    Retorna (vizinhos, dono), onde dono[k] é a posição em vertices de quem gerou vizinhos[k].
+    """
+    import numpy as np
+
+    inicio = indptr[vertices]
+    graus = indptr[vertices + 1] - inicio
+    total = int(graus.sum())
+    if total == 0:
+        return indices[:0], np.zeros(0, dtype=np.int64)
+    deslocamento = np.cumsum(graus) - graus
+    pos = np.repeat(inicio - deslocamento, graus) + np.arange(total)
+    return indices[pos], np.repeat(np.arange(vertices.size), graus)
+
+
+def _bfs_niveis_csr(indptr, indices, fonte, indptr_t=None, indices_t=None):
+    """
+    BFS síncrona por níveis: a fronteira inteira é expandida de uma vez.
+    Com o CSR transposto (indptr_t/indices_t), cada nível escolhe a direção mais
+    barata: top-down (arestas que saem da fronteira) ou bottom-up (arestas que
+    entram nos vértices ainda não visitados). Retorna dist (-1 se inalcançável).
+    """
+    import numpy as np
+
+    n = indptr.size - 1
+    dist = np.full(n, -1, dtype=np.int32)
+    dist[fonte] = 0
+    fronteira = np.array([fonte], dtype=np.int64)
+    grau_entrada = np.diff(indptr_t) if indptr_t is not None else None
+    nivel = 0
+    niveis_bottom_up = 0
+    arestas_examinadas = 0
+    while fronteira.size:
+        nivel += 1
+        custo_top_down = int((indptr[fronteira + 1] - indptr[fronteira]).sum())
+        if grau_entrada is not None:
+            nao_visitados = np.flatnonzero(dist < 0)
+            custo_bottom_up = int(grau_entrada[nao_visitados].sum())
+        if grau_entrada is not None and custo_bottom_up < custo_top_down:
+            niveis_bottom_up += 1
+            arestas_examinadas += custo_bottom_up
+            na_fronteira = np.zeros(n, dtype=bool)
+            na_fronteira[fronteira] = True
+            pred, dono = _expandir(indptr_t, indices_t, nao_visitados)
+            achou = np.zeros(nao_visitados.size, dtype=bool)
+            achou[dono[na_fronteira[pred]]] = True
+            fronteira = nao_visitados[achou]
+        else:
+            arestas_examinadas += custo_top_down
+            vizinhos, _ = _expandir(indptr, indices, fronteira)
+            fronteira = np.unique(vizinhos[dist[vizinhos] < 0]).astype(np.int64)
+        dist[fronteira] = nivel
+    contar("bfs_fronteira.niveis", nivel)
+    contar("bfs_fronteira.niveis_bottom_up", niveis_bottom_up)
+    contar("bfs_fronteira.arestas_examinadas", arestas_examinadas)
+    return dist
+
+
+def bfs_fronteira(G: Grafo, no_fonte, direcao_otimizada=True):
+    """
+    Distâncias em arestas a partir de no_fonte, expandindo cada nível com
+    operações NumPy sobre o CSR de G (alterna top-down/bottom-up se
+    direcao_otimizada). Retorna array int32 na ordem de G.csr().vertices,
+    com -1 para vértices inalcançáveis.
+    """
+    csr = G.csr()
+    indptr_t = indices_t = None
+    if direcao_otimizada:
+        t = csr.transposta()
+        indptr_t, indices_t = t.indptr, t.indices
+    return _bfs_niveis_csr(csr.indptr, csr.indices, csr.indice(no_fonte), indptr_t, indices_t)
+
+
+def _bfs_bitset_csr(indptr_t, indices_t, fontes, n):
+    """
+    Até 64 BFS simultâneas: o bit b de cada palavra uint64 indica se o vértice
+    está na fronteira (ou foi visitado) pela busca da fonte fontes[b].
+    A fronteira seguinte é o OR das palavras dos vizinhos de entrada.
+    """
+    import numpy as np
+
+    k = len(fontes)
+    dist = np.full((k, n), -1, dtype=np.int32)
+    visitado = np.zeros(n, dtype=np.uint64)
+    fronteira = np.zeros(n, dtype=np.uint64)
+    for b, s in enumerate(fontes):
+        bit = np.uint64(1) << np.uint64(b)
+        visitado[s] |= bit
+        fronteira[s] |= bit
+        dist[b, s] = 0
+
+    vazios = np.diff(indptr_t) == 0
+    nivel = 0
+    while fronteira.any():
+        nivel += 1
+        palavras = np.append(fronteira[indices_t], np.uint64(0))  # sentinela p/ segmentos no fim
+        proxima = np.bitwise_or.reduceat(palavras, indptr_t[:-1])
+        proxima[vazios] = 0
+        proxima &= ~visitado
+        visitado |= proxima
+        alterados = np.flatnonzero(proxima)
+        bits = proxima[alterados]
+        for b in range(k):
+            novos = alterados[((bits >> np.uint64(b)) & np.uint64(1)).astype(bool)]
+            dist[b, novos] = nivel
+        fronteira = proxima
+    contar("bfs_multiplas_fontes.niveis", nivel)
+    contar("bfs_multiplas_fontes.arestas_examinadas", nivel * indices_t.size)
+    return dist
+
+
+def bfs_multiplas_fontes(G: Grafo, fontes):
+    """
+    Linhas de distância (em arestas) para várias fontes, processando-as em
+    lotes de 64 com bitsets. Retorna array int32 (len(fontes), V) na ordem de
+    G.csr().vertices, com -1 para inalcançáveis.
+    """
+    import numpy as np
+
+    csr = G.csr()
+    t = csr.transposta()
+    n = csr.num_vertices()
+    idx = [csr.indice(s) for s in fontes]
+    dist = np.empty((len(idx), n), dtype=np.int32)
+    for ini in range(0, len(idx), 64):
+        contar("bfs_multiplas_fontes.lotes")
+        dist[ini:ini + 64] = _bfs_bitset_csr(t.indptr, t.indices, idx[ini:ini + 64], n)
+    return dist
+
+
+def imprimir_rastreio(evento, v, d, pi):
+    """
+    Rastreio no formato didático original (cores BRANCO/CINZA/PRETO).
+    """
+    if evento in ("fonte", "descoberta"):
+        print(f"BFS({v})")
+        print(f"Cor[{v}] = CINZA")
+        print(f"D[{v}] = {d[v]}")
+        print(f"PI[{v}] = {pi[v]}")
+        print("\n=============================" if evento == "fonte" else "")
+    elif evento == "visita":
+        print("==================")
+    elif evento == "finalizacao":
+        print(f"Cor[{v}] = PRETO")
+
+
+if __name__ == "__main__":
+    i=time.time()
+    grafo = Grafo(vertices=[1,2,3,4,5,6,7,8], arestas=[(1,2),(1,8),(1,7),(1,6),(2,8),(8,7), (6,7) ,(6,3),(3,4), (4,5)], direcionado=False)
+    bfs(grafo, 7, rastreio=imprimir_rastreio)
+    print(f"tempo em ms: ",(time.time()-i)*1000)
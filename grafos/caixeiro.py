@@ -0,0 +1,209 @@
+# Heurísticas para o caixeiro viajante (ciclo hamiltoniano de custo mínimo)
+# 1. Vizinho mais próximo sobre a matriz de distâncias, com máscara de visitados
+#    (O(V^2) por vértice inicial), a partir de vários inícios em paralelo
+# 2. Melhoria local com 2-opt (grafo simétrico) e Or-opt, usando listas de
+#    vizinhos mais próximos para limitar os movimentos testados
+
+import numpy as np
+
+from .grafo_utils import Grafo
+from .instrumentacao import contar, fase
+
+
+# -------------------- matriz de distâncias --------------------
+def matriz_distancias(G: Grafo):
+    """
+    Matriz V x V de pesos (inf onde não há arco, 0 na diagonal), na ordem de
+    G.csr().vertices. Grafo não ponderado usa peso 1.
+    """
+    D = G.csr().matriz_numpy(ponderada=True, default=np.inf, dtype=np.float64)
+    np.fill_diagonal(D, 0)
+    return D
+
+
+def custo_tour(D, tour):
+    """
+    Custo do ciclo que visita tour (índices) e volta ao primeiro.
+    """
+    tour = np.asarray(tour)
+    return float(D[tour, np.roll(tour, -1)].sum())
+
+
+# -------------------- construção --------------------
+def vizinho_mais_proximo(D, inicio=0):
+    """
+    Tour guloso a partir de inicio. Retorna lista de índices ou None se cair
+    num beco sem saída (nenhum vértice livre alcançável ou sem arco de volta).
+    """
+    n = D.shape[0]
+    livre = np.ones(n, dtype=bool)
+    tour = [inicio]
+    livre[inicio] = False
+    atual = inicio
+    for _ in range(n - 1):
+        linha = np.where(livre, D[atual], np.inf)
+        proximo = int(np.argmin(linha))
+        if not np.isfinite(linha[proximo]):
+            return None
+        tour.append(proximo)
+        livre[proximo] = False
+        atual = proximo
+    if not np.isfinite(D[atual, inicio]):
+        return None
+    return tour
+
+
+# -------------------- melhoria local --------------------
+def listas_vizinhos(D, k=10):
+    """
+    Para cada vértice, os k vizinhos mais próximos (por D[v, :]) em ordem crescente.
+    """
+    n = D.shape[0]
+    k = min(k, n - 1)
+    if k <= 0:
+        return [[] for _ in range(n)]
+    sem_diagonal = D + np.diag(np.full(n, np.inf))
+    candidatos = np.argpartition(sem_diagonal, k - 1, axis=1)[:, :k]
+    ordem = np.take_along_axis(sem_diagonal, candidatos, axis=1).argsort(axis=1, kind="stable")
+    return np.take_along_axis(candidatos, ordem, axis=1).tolist()
+
+
+def dois_opt(D, tour, vizinhos):
+    """
+    2-opt com primeira melhoria: troca (a,b),(c,d) por (a,c),(b,d) invertendo
+    o trecho entre b e c. Só testa c entre os vizinhos de a mais próximos que b.
+    Válido apenas para D simétrica. Altera e retorna tour.
+    """
+    n = len(tour)
+    if n < 4:
+        return tour
+    dist = D.tolist() if isinstance(D, np.ndarray) else D
+    pos = [0] * n
+    for i, v in enumerate(tour):
+        pos[v] = i
+
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for i in range(n):
+            a, b = tour[i], tour[(i + 1) % n]
+            dab = dist[a][b]
+            for c in vizinhos[a]:
+                dac = dist[a][c]
+                if dac >= dab:
+                    break
+                j = pos[c]
+                d = tour[(j + 1) % n]
+                if c == b or d == a:
+                    continue
+                if dac + dist[b][d] - dab - dist[c][d] < -1e-12:
+                    ini, fim = (i + 1, j) if i < j else (j + 1, i)
+                    tour[ini:fim + 1] = tour[ini:fim + 1][::-1]
+                    for p in range(ini, fim + 1):
+                        pos[tour[p]] = p
+                    melhorou = True
+                    break
+    return tour
+
+
+def or_opt(D, tour, vizinhos, tamanho_max=3):
+    """
+    Or-opt: move trechos de 1..tamanho_max vértices consecutivos para entre
+    c e seu sucessor, com c entre os vizinhos do início do trecho (sem inverter
+    o trecho, então vale também para D assimétrica). Altera e retorna tour.
+    """
+    n = len(tour)
+    if n < 4:
+        return tour
+    dist = D.tolist() if isinstance(D, np.ndarray) else D
+    pos = [0] * n
+    for i, v in enumerate(tour):
+        pos[v] = i
+
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for tamanho in range(1, min(tamanho_max, n - 2) + 1):
+            i = 0
+            while i < n:
+                trecho = [tour[(i + k) % n] for k in range(tamanho)]
+                p, prox = tour[(i - 1) % n], tour[(i + tamanho) % n]
+                s0, s1 = trecho[0], trecho[-1]
+                ganho = dist[p][s0] + dist[s1][prox] - dist[p][prox]
+                movido = False
+                for c in vizinhos[s0]:
+                    if c == p or c in trecho:
+                        continue
+                    # fora do trecho, só p tem o trecho como sucessor
+                    d = tour[(pos[c] + 1) % n]
+                    if dist[c][s0] + dist[s1][d] - dist[c][d] - ganho < -1e-12:
+                        restante = [v for v in tour if v not in trecho]
+                        k = restante.index(c)
+                        tour[:] = restante[:k + 1] + trecho + restante[k + 1:]
+                        for j, v in enumerate(tour):
+                            pos[v] = j
+                        movido = melhorou = True
+                        break
+                if not movido:
+                    i += 1
+    return tour
+
+
+# -------------------- várias partidas --------------------
+_D_TRABALHO = None
+
+
+def _iniciar_trabalhador(D, vizinhos, simetrica):
+    global _D_TRABALHO
+    _D_TRABALHO = (D, vizinhos, simetrica)
+
+
+def _rota_a_partir_de(inicio):
+    D, vizinhos, simetrica = _D_TRABALHO
+    tour = vizinho_mais_proximo(D, inicio)
+    if tour is None:
+        return float("inf"), None
+    if vizinhos is not None:
+        if simetrica:
+            dois_opt(D, tour, vizinhos)
+        or_opt(D, tour, vizinhos)
+    return custo_tour(D, tour), tour
+
+
+def rota_heuristica(G: Grafo, inicios=None, processos=None, melhorar=True, k_vizinhos=10):
+    """
+    Vizinho mais próximo a partir de cada vértice em inicios (todos, por padrão),
+    seguido de 2-opt/Or-opt se melhorar=True; fica o tour mais barato.
+    Com processos > 1 as partidas rodam num pool.
+    Retorna (H, custo): H é o ciclo de labels [v0, ..., v0] como em
+    bellmore_nemhauser, ou (None, inf) se nenhuma partida fechou um ciclo.
+    """
+    csr = G.csr()
+    vertices = csr.vertices
+    D = matriz_distancias(G)
+    if inicios is None:
+        partidas = range(len(vertices))
+    else:
+        partidas = [csr.indice(v) for v in inicios]
+    vizinhos = listas_vizinhos(D, k_vizinhos) if melhorar else None
+    simetrica = bool(np.array_equal(D, D.T))
+
+    contar("rota_heuristica.partidas", len(partidas))
+    with fase("rota_heuristica.partidas"):
+        if processos and processos > 1:
+            from multiprocessing import Pool
+            with Pool(processos, initializer=_iniciar_trabalhador, initargs=(D, vizinhos, simetrica)) as pool:
+                resultados = pool.map(_rota_a_partir_de, partidas)
+        else:
+            _iniciar_trabalhador(D, vizinhos, simetrica)
+            resultados = [_rota_a_partir_de(i) for i in partidas]
+
+    melhor_custo, melhor_tour = float("inf"), None
+    for custo, tour in resultados:
+        if tour is not None and custo < melhor_custo:
+            melhor_custo, melhor_tour = custo, tour
+    if melhor_tour is None:
+        return None, float("inf")
+    H = [vertices[i] for i in melhor_tour]
+    H.append(H[0])
+    return H, melhor_custo
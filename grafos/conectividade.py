@@ -0,0 +1,206 @@
+# -------------------- estrutura de índices --------------------
+def _estrutura(G=None, m=None):
+    """
+    Retorna (n, indptr, indices) como listas Python, a partir do grafo
+    (via CSR) ou de uma matriz de adjacência m, densa ou scipy.sparse
+    (qualquer valor != 0 é arco).
+    """
+    import numpy as np
+
+    if m is not None:
+        if hasattr(m, "tocoo"):  # scipy.sparse (ex.: G.matriz_esparsa())
+            m = m.tocoo()
+            n = m.shape[0]
+            nao_nulos = m.data != 0
+            src, dst = m.row[nao_nulos], m.col[nao_nulos]
+        else:
+            m = np.asarray(m)
+            n = m.shape[0]
+            src, dst = np.nonzero(m)
+        ordem = np.argsort(src, kind="stable")
+        src, dst = src[ordem], dst[ordem]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return n, indptr.tolist(), dst.tolist()
+    csr = G.csr()
+    return csr.num_vertices(), csr.indptr.tolist(), csr.indices.tolist()
+
+
+def _rotulos_componentes(n, indptr, indices):
+    """
+    Union-find (com compressão de caminho) ignorando a direção dos arcos.
+    Retorna o representante de cada vértice.
+    """
+    pai = list(range(n))
+
+    def raiz(x):
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    for u in range(n):
+        for pos in range(indptr[u], indptr[u + 1]):
+            ru, rv = raiz(u), raiz(indices[pos])
+            if ru != rv:
+                pai[rv] = ru
+    return [raiz(x) for x in range(n)]
+
+
+def _rotulos_cfc(n, indptr, indices):
+    """
+    Tarjan iterativo (pilha explícita, sem limite de recursão).
+    Retorna (componente de cada vértice, número de componentes).
+    """
+    ordem = [-1] * n
+    low = [0] * n
+    comp = [-1] * n
+    na_pilha = [False] * n
+    proximo = list(indptr[:n])  # próximo arco a examinar de cada vértice
+    pilha = []
+    contador = 0
+    total = 0
+
+    for raiz in range(n):
+        if ordem[raiz] != -1:
+            continue
+        ordem[raiz] = low[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        na_pilha[raiz] = True
+        chamadas = [raiz]
+
+        while chamadas:
+            v = chamadas[-1]
+            if proximo[v] < indptr[v + 1]:
+                w = indices[proximo[v]]
+                proximo[v] += 1
+                if ordem[w] == -1:
+                    ordem[w] = low[w] = contador
+                    contador += 1
+                    pilha.append(w)
+                    na_pilha[w] = True
+                    chamadas.append(w)
+                elif na_pilha[w] and ordem[w] < low[v]:
+                    low[v] = ordem[w]
+                continue
+
+            chamadas.pop()
+            if chamadas and low[v] < low[chamadas[-1]]:
+                low[chamadas[-1]] = low[v]
+            if low[v] == ordem[v]:
+                while True:
+                    w = pilha.pop()
+                    na_pilha[w] = False
+                    comp[w] = total
+                    if w == v:
+                        break
+                total += 1
+
+    return comp, total
+
+
+def _agrupar(G, rotulos):
+    grupos = {}
+    for v, r in zip(G.csr().vertices, rotulos):
+        grupos.setdefault(r, []).append(v)
+    return list(grupos.values())
+
+
+# -------------------- componentes --------------------
+def componentes_conexas(G):
+    """
+    Componentes fracamente conexas (conexas, se G não é direcionado),
+    como lista de listas de labels.
+    """
+    return _agrupar(G, _rotulos_componentes(*_estrutura(G)))
+
+
+def componentes_fortemente_conexas(G):
+    """
+    Componentes fortemente conexas (Tarjan), como lista de listas de labels.
+    """
+    comp, _ = _rotulos_cfc(*_estrutura(G))
+    return _agrupar(G, comp)
+
+
+def fracamente_conexo(G):
+    n, indptr, indices = _estrutura(G)
+    return len(set(_rotulos_componentes(n, indptr, indices))) <= 1
+
+
+def fortemente_conexo(G):
+    _, total = _rotulos_cfc(*_estrutura(G))
+    return total <= 1
+
+
+def conexo(G=None, m=None, ignorar_indices=None):
+    """
+    Mesma resposta de Grafo.conexo_por_mm, em O(V + E): todo par de vértices
+    fora de ignorar_indices deve ser mutuamente alcançável (caminhos podem
+    passar pelos ignorados). m, se dada, substitui a matriz de adjacência de G.
+    """
+    n, indptr, indices = _estrutura(G, m)
+    ignorados = set(ignorar_indices or [])
+    comp, _ = _rotulos_cfc(n, indptr, indices)
+    restantes = {comp[i] for i in range(n) if i not in ignorados}
+    return len(restantes) <= 1
+
+
+# -------------------- pontes --------------------
+def _pontes(adj, raizes):
+    """
+    Tarjan (low-link) iterativo sobre adj não direcionada (adj[v] = iterável de
+    vizinhos; laços são ignorados e arestas paralelas contam como ciclo).
+    Visita apenas as componentes das raízes dadas.
+    Retorna (pontes como conjunto de pares (i, j) com i < j, vértices visitados).
+    """
+    ordem = {}
+    low = {}
+    encontradas = set()
+    contador = 0
+    for raiz in raizes:
+        if raiz in ordem:
+            continue
+        ordem[raiz] = low[raiz] = contador
+        contador += 1
+        pilha = [[raiz, -1, iter(adj[raiz]), False]]  # vértice, pai, vizinhos, já pulou o pai
+        while pilha:
+            quadro = pilha[-1]
+            v, p, vizinhos = quadro[0], quadro[1], quadro[2]
+            for w in vizinhos:
+                if w == v:
+                    continue
+                if w == p and not quadro[3]:
+                    quadro[3] = True
+                    continue
+                if w in ordem:
+                    if ordem[w] < low[v]:
+                        low[v] = ordem[w]
+                else:
+                    ordem[w] = low[w] = contador
+                    contador += 1
+                    pilha.append([w, v, iter(adj[w]), False])
+                    break
+            else:
+                pilha.pop()
+                if p != -1:
+                    if low[v] < low[p]:
+                        low[p] = low[v]
+                    if low[v] > ordem[p]:
+                        encontradas.add((p, v) if p < v else (v, p))
+    return encontradas, ordem.keys()
+
+
+def pontes(G):
+    """
+    Pontes de um grafo não direcionado, como lista de pares (u, v) de labels.
+    """
+    if G.direcionado:
+        raise ValueError("Pontes só são definidas aqui para grafo não direcionado")
+    vertices = G.vertices
+    idx = {v: i for i, v in enumerate(vertices)}
+    lista = G.lista_adjacencias()
+    adj = [[idx[w] for w in lista[v]] for v in vertices]
+    encontradas, _ = _pontes(adj, range(len(vertices)))
+    return [(vertices[i], vertices[j]) for (i, j) in sorted(encontradas)]
@@ -0,0 +1,149 @@
+from .grafo_utils import Grafo
+from .instrumentacao import ativo, contar
+
+
+def dfs(G: Grafo, no_init=None, rastreio=None):
+    """
+    Busca em profundidade iterativa (pilha explícita, sem limite de recursão).
+    no_init: vértice por onde a busca começa (G.vertices não é alterado).
+    Retorna (d, f, pi, ciclos): tempos de descoberta e término, pai na floresta
+    e arestas de retorno (u, v) que fecham ciclos. Em grafo não direcionado a
+    aresta de volta ao pai não conta como ciclo.
+    rastreio: função opcional chamada como rastreio(evento, v, d, f, pi), com
+    evento em "descoberta", "ciclo" (v é a aresta (u, w)) e "finalizacao".
+    """
+    lista_adj = G.lista_adjacencias(ordenada=True)
+    vertices = list(G.vertices)
+    if no_init is not None:
+        idx_no_init = vertices.index(no_init)
+        vertices[0], vertices[idx_no_init] = no_init, vertices[0]
+
+    d = {}
+    f = {}
+    pi = {v: None for v in vertices}
+    ciclos = []
+    time = 0
+
+    for raiz in vertices:
+        if raiz in d:
+            continue
+        time += 1
+        d[raiz] = time
+        if rastreio:
+            rastreio("descoberta", raiz, d, f, pi)
+        pilha = [[raiz, iter(lista_adj[raiz]), False]]  # vértice, vizinhos, já pulou o pai
+
+        while pilha:
+            quadro = pilha[-1]
+            v = quadro[0]
+            for v_adj in quadro[1]:
+                if v_adj not in d:
+                    pi[v_adj] = v
+                    time += 1
+                    d[v_adj] = time
+                    if rastreio:
+                        rastreio("descoberta", v_adj, d, f, pi)
+                    pilha.append([v_adj, iter(lista_adj[v_adj]), False])
+                    break
+                if v_adj not in f:  # CINZA: está na pilha, fecha um ciclo
+                    if not G.direcionado and v_adj == pi[v] and not quadro[2]:
+                        quadro[2] = True
+                        continue
+                    ciclos.append((v, v_adj))
+                    if rastreio:
+                        rastreio("ciclo", (v, v_adj), d, f, pi)
+            else:
+                pilha.pop()
+                time += 1
+                f[v] = time
+                if rastreio:
+                    rastreio("finalizacao", v, d, f, pi)
+
+    if ativo():
+        # a busca é completa: toda lista de adjacência é percorrida até o fim
+        contar("dfs.vertices_visitados", len(d))
+        contar("dfs.arestas_examinadas", sum(len(lista_adj[v]) for v in d))
+        contar("dfs.arestas_de_retorno", len(ciclos))
+    return d, f, pi, ciclos
+
+
+def dfs_eventos(G: Grafo, no_init=None, completa=True):
+    """
+    Versão preguiçosa da busca em profundidade: gera eventos (evento, u, v)
+    sob demanda, na mesma ordem de dfs:
+      ("descoberta", u, v)  -> v descoberto pela aresta de árvore (u, v); u=None numa raiz
+      ("retorno", u, v)     -> aresta de retorno (fecha ciclo)
+      ("finalizacao", u, v) -> v terminou; u é o pai (None numa raiz)
+    completa=False explora só a partir de no_init. Além da lista de adjacências
+    do próprio grafo (sem ordenar), a memória fica proporcional à pilha e aos
+    vértices já vistos: os vizinhos são ordenados quando o vértice é empilhado.
+    """
+    lista_adj = G.lista_adjacencias()
+    if no_init is not None and not completa:
+        raizes = [no_init]
+    else:
+        raizes = list(G.vertices)
+        if no_init is not None:
+            idx_no_init = raizes.index(no_init)
+            raizes[0], raizes[idx_no_init] = no_init, raizes[0]
+
+    terminado = {}  # vértice -> False (CINZA) / True (PRETO)
+    for raiz in raizes:
+        if raiz in terminado:
+            continue
+        terminado[raiz] = False
+        yield ("descoberta", None, raiz)
+        pilha = [[raiz, None, iter(sorted(lista_adj[raiz])), False]]  # vértice, pai, vizinhos, já pulou o pai
+
+        while pilha:
+            quadro = pilha[-1]
+            v, pai = quadro[0], quadro[1]
+            for v_adj in quadro[2]:
+                if v_adj not in terminado:
+                    terminado[v_adj] = False
+                    yield ("descoberta", v, v_adj)
+                    pilha.append([v_adj, v, iter(sorted(lista_adj[v_adj])), False])
+                    break
+                if not terminado[v_adj]:
+                    if not G.direcionado and v_adj == pai and not quadro[3]:
+                        quadro[3] = True
+                        continue
+                    yield ("retorno", v, v_adj)
+            else:
+                pilha.pop()
+                terminado[v] = True
+                yield ("finalizacao", pai, v)
+
+
+def imprimir_rastreio(evento, v, d, f, pi):
+    """
+    Rastreio no formato didático original (cores BRANCO/CINZA/PRETO).
+    """
+    if evento == "descoberta":
+        print(f"DFS({v})")
+        print(f"Cor[{v}] = CINZA")
+        print(f"D[{v}] = {d[v]}")
+        print(f"Pi[{v}] = {pi[v]}")
+        print("\n===============================")
+    elif evento == "ciclo":
+        v, v_adj = v
+        print(f"Ciclo detectado: {v} -> {v_adj}")
+        # Reconstrói o ciclo subindo pelos pais
+        ciclo = []
+        temp = v
+        while temp != v_adj:
+            ciclo.append(temp)
+            temp = pi[temp]
+        ciclo.append(v_adj)  # Adiciona o nó de onde o ciclo começou
+        ciclo.append(v)
+        ciclo.reverse()  # Inverte para mostrar o ciclo na ordem correta
+        print(f"Ciclo: {' -> '.join(map(str, ciclo))}")
+    elif evento == "finalizacao":
+        print(f"Cor[{v}] = PRETO")
+        print(f"F[{v}] = {f[v]}")
+
+
+if __name__ == "__main__":
+    grafo = Grafo(vertices=[1,2,3,4,5,6,7], arestas=[(1,2),(1,3),(1,4),(2,4),(2,6),(6,5), (6,7) ,(5,7),(7,4), (4,3)], direcionado=False)
+
+    dfs(grafo, no_init=2, rastreio=imprimir_rastreio)
@@ -0,0 +1,119 @@
+from heapq import heappop, heappush
+from itertools import count
+
+from .grafo_utils import Grafo
+from .instrumentacao import contar
+
+
+def _dijkstra_csr(indptr, indices, pesos, origem, destino=-1):
+    """
+    Dijkstra com heap binário e remoção preguiçosa sobre listas CSR
+    (pesos não negativos). Para ao fechar destino, se informado.
+    Retorna (dist, pred) como listas por índice.
+    """
+    n = len(indptr) - 1
+    dist = [float("inf")] * n
+    pred = [-1] * n
+    fechado = [False] * n
+    dist[origem] = 0
+    heap = [(0, origem)]
+    retiradas = 0
+    relaxacoes = 0
+    while heap:
+        d, u = heappop(heap)
+        retiradas += 1
+        if fechado[u]:
+            continue
+        fechado[u] = True
+        if u == destino:
+            break
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = indices[pos]
+            nd = d + pesos[pos]
+            if nd < dist[v]:
+                relaxacoes += 1
+                dist[v] = nd
+                pred[v] = u
+                heappush(heap, (nd, v))
+    contar("dijkstra.retiradas_do_heap", retiradas)
+    contar("dijkstra.relaxacoes", relaxacoes)
+    return dist, pred
+
+
+def _busca(adj, origem, destino=None, heuristica=None):
+    """
+    Núcleo de Dijkstra/A* sobre lista de adjacências ponderada {v: [(w, peso)]}.
+    Entradas velhas do heap são descartadas na retirada (remoção preguiçosa);
+    com heurística admissível mas inconsistente, vértices podem ser reabertos.
+    Retorna (dist, pai) só com os vértices alcançados.
+    """
+    dist = {origem: 0}
+    pai = {origem: None}
+    desempate = count()
+    h0 = heuristica(origem, destino) if heuristica else 0
+    heap = [(h0, next(desempate), 0, origem)]
+    retiradas = 0
+    while heap:
+        _, _, d, u = heappop(heap)
+        retiradas += 1
+        if d > dist[u]:
+            continue
+        if u == destino:
+            break
+        for (v, w) in adj[u]:
+            if w < 0:
+                raise ValueError("Dijkstra não aceita pesos negativos")
+            nd = d + w
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                pai[v] = u
+                f = nd + heuristica(v, destino) if heuristica else nd
+                heappush(heap, (f, next(desempate), nd, v))
+    contar("dijkstra.retiradas_do_heap", retiradas)
+    contar("dijkstra.vertices_alcancados", len(dist))
+    return dist, pai
+
+
+def dijkstra(grafo: Grafo, origem, destino=None, heuristica=None):
+    """
+    Caminho mínimo de origem com pesos não negativos, em O(E log V).
+    destino: para a busca assim que o destino é fechado (dist/pai dos demais
+             vértices podem ficar provisórios).
+    heuristica(v, destino): estimativa admissível da distância restante (A*).
+    Retorna (dist, pai) como bellman_ford.
+    """
+    adj = grafo.lista_adjacencias(ponderada=True)
+    if origem not in adj:
+        raise ValueError("Vértice de origem não existe")
+    parcial_d, parcial_p = _busca(adj, origem, destino, heuristica)
+    dist = {v: parcial_d.get(v, float("inf")) for v in grafo.vertices}
+    pai = {v: parcial_p.get(v) for v in grafo.vertices}
+    return dist, pai
+
+
+def tem_arco_negativo(grafo: Grafo):
+    return grafo.ponderado and any(w < 0 for (_, _, w) in grafo._iter_arcos_pesos())
+
+
+def caminho_minimo(grafo: Grafo, origem, destino=None):
+    """
+    Ponto de entrada comum: usa dijkstra e só recorre ao bellman_ford quando
+    o grafo tem arcos negativos. Retorna (dist, pai).
+    """
+    if tem_arco_negativo(grafo):
+        from .bellman_ford import bellman_ford
+        return bellman_ford(grafo, origem)
+    return dijkstra(grafo, origem, destino)
+
+
+def montar_caminho(pai, origem, destino):
+    """
+    Lista de labels de origem a destino seguindo pai ([] se inalcançável).
+    """
+    if destino != origem and pai.get(destino) is None:
+        return []
+    caminho = [destino]
+    while caminho[-1] != origem:
+        caminho.append(pai[caminho[-1]])
+    caminho.reverse()
+    return caminho
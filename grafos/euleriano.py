@@ -0,0 +1,152 @@
+from collections import Counter
+
+from .conectividade import _rotulos_componentes
+from .instrumentacao import contar, fase
+
+
+# -------------------- preparação --------------------
+def _arestas_indexadas(G):
+    """
+    Converte os arcos de G em arestas (i, j) sobre índices de G.vertices.
+    Em grafo não direcionado cada aresta aparece duas vezes nos arcos; laços
+    podem aparecer uma ou duas vezes, por isso conta-se (total + 1) // 2.
+    """
+    idx = {}
+    for v in G.vertices:
+        idx.setdefault(v, len(idx))
+    if G.direcionado:
+        return idx, [(idx[u], idx[v]) for (u, v) in G._iter_arcos()]
+
+    pares = Counter()
+    for (u, v) in G._iter_arcos():
+        i, j = idx[u], idx[v]
+        pares[(i, j) if i <= j else (j, i)] += 1
+    arestas = []
+    for par, total in pares.items():
+        arestas.extend([par] * ((total + 1) // 2))
+    return idx, arestas
+
+
+def _analisar(G):
+    """
+    Verifica paridade/balanço de graus e conectividade.
+    Retorna (idx, arestas, tipo, inicio) com tipo "circuito" ou "caminho";
+    tipo é None quando não existe caminho euleriano.
+    """
+    idx, arestas = _arestas_indexadas(G)
+    n = len(idx)
+    saida = [0] * n
+    entrada = [0] * n
+    for (i, j) in arestas:
+        saida[i] += 1
+        entrada[j] += 1
+
+    if G.direcionado:
+        saldo = [saida[i] - entrada[i] for i in range(n)]
+        inicios = [i for i in range(n) if saldo[i] == 1]
+        fins = [i for i in range(n) if saldo[i] == -1]
+        if any(abs(s) > 1 for s in saldo) or len(inicios) != len(fins) or len(inicios) > 1:
+            return idx, arestas, None, None
+    else:
+        inicios = [i for i in range(n) if (saida[i] + entrada[i]) % 2]
+        if len(inicios) not in (0, 2):
+            return idx, arestas, None, None
+
+    # todos os vértices com arestas devem estar na mesma componente
+    indptr = [0] * (n + 1)
+    for (i, _) in arestas:
+        indptr[i + 1] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
+    indices = [0] * len(arestas)
+    pos = indptr[:n]
+    for (i, j) in arestas:
+        indices[pos[i]] = j
+        pos[i] += 1
+    rotulos = _rotulos_componentes(n, indptr, indices)
+    if len({rotulos[i] for i in range(n) if saida[i] + entrada[i]}) > 1:
+        raise ValueError("Grafo não é conexo")
+
+    if inicios:
+        return idx, arestas, "caminho", inicios[0]
+    com_arestas = [i for i in range(n) if saida[i] + entrada[i]]
+    return idx, arestas, "circuito", (com_arestas[0] if com_arestas else None)
+
+
+def tipo_euleriano(G):
+    """
+    Retorna "circuito", "caminho" ou None (sem caminho euleriano).
+    """
+    try:
+        return _analisar(G)[2]
+    except ValueError:
+        return None
+
+
+# -------------------- Hierholzer --------------------
+def caminho_euleriano(G, inicio=None, modo="hierholzer"):
+    """
+    Retorna o circuito (ou caminho) euleriano como lista de arestas [(u, v), ...].
+    modo="hierholzer": O(E), para grafos direcionados e não direcionados.
+    modo="fleury": usa alg_fleury como referência (só não direcionado).
+    inicio escolhe o vértice de partida: num circuito, qualquer um com arestas;
+    num caminho, um dos dois de grau ímpar (direcionado: o de saída > entrada).
+    """
+    if modo == "fleury":
+        if G.direcionado:
+            raise ValueError("Fleury só está implementado para grafo não direcionado")
+        from .alg_fleury import alg_fleury
+        return alg_fleury(G)
+    if modo != "hierholzer":
+        raise ValueError(f"Modo desconhecido: {modo}")
+
+    with fase("euleriano.analise"):
+        idx, arestas, tipo, s = _analisar(G)
+    if tipo is None:
+        raise ValueError("Grafo não possui caminho euleriano")
+    if not arestas:
+        return []
+    if inicio is not None:
+        if inicio not in idx:
+            raise ValueError("Vértice inicial não existe")
+        i = idx[inicio]
+        if tipo == "caminho" and G.direcionado and i != s:
+            raise ValueError(f"Caminho euleriano deve começar em {G.vertices[s]}")
+        if tipo == "caminho" and not G.direcionado:
+            grau = sum((a == i) + (b == i) for (a, b) in arestas)
+            if grau % 2 == 0:
+                raise ValueError("Caminho euleriano deve começar num vértice de grau ímpar")
+        s = i
+
+    n = len(idx)
+    adj = [[] for _ in range(n)]
+    for e, (i, j) in enumerate(arestas):
+        adj[i].append((j, e))
+        if not G.direcionado and i != j:
+            adj[j].append((i, e))
+    for lista in adj:
+        lista.sort()
+    if not adj[s]:
+        raise ValueError("Vértice inicial não possui arestas")
+
+    usada = [False] * len(arestas)
+    prox = [0] * n
+    pilha = [s]
+    sequencia = []
+    while pilha:
+        v = pilha[-1]
+        lista = adj[v]
+        while prox[v] < len(lista) and usada[lista[prox[v]][1]]:
+            prox[v] += 1
+        if prox[v] == len(lista):
+            sequencia.append(pilha.pop())
+        else:
+            w, e = lista[prox[v]]
+            prox[v] += 1
+            usada[e] = True
+            pilha.append(w)
+
+    sequencia.reverse()
+    contar("euleriano.arestas_percorridas", len(sequencia) - 1)
+    labels = list(idx)
+    return [(labels[a], labels[b]) for a, b in zip(sequencia, sequencia[1:])]
@@ -0,0 +1,202 @@
+# Distâncias a partir de muitas origens num pool de processos, com o grafo
+# publicado uma única vez em memória compartilhada (multiprocessing.shared_memory).
+# O processo principal copia os arrays CSR (o transposto, para BFS), a lista
+# de origens e a matriz de saída para blocos compartilhados; os trabalhadores
+# recebem só os nomes dos blocos e, por tarefa, um trecho [inicio, fim) das
+# origens, cujas linhas de distância escrevem direto na matriz. Nenhum processo
+# copia o grafo: a BFS usa os arrays NumPy e Dijkstra/spfa leem o CSR por
+# memoryviews sobre os mesmos blocos (acesso por item tão rápido quanto o de
+# listas, devolvendo int/float do Python, sem a cópia privada). Cada linha tem
+# posição fixa (a da origem na lista), então o resultado não depende do número
+# de processos nem da ordem em que as tarefas terminam.
+#     D = distancias_multiplas_origens(G, processos=8)          # todas as origens
+#     D = distancias_multiplas_origens(G, [1, 5, 9], algoritmo="bfs")
+
+import numpy as np
+
+from .grafo_utils import Grafo
+from .bellman_ford import _spfa_csr
+from .bfs import _bfs_bitset_csr
+from .dijkstra import _dijkstra_csr
+from .instrumentacao import contar, fase
+
+ALGORITMOS = ("sssp", "dijkstra", "bellman_ford", "bfs")
+_LARGURA_BITSET = 64  # fontes por passada de _bfs_bitset_csr
+
+_TRABALHO = None
+_SHM_TRABALHO = []
+
+
+# -------------------- núcleos --------------------
+def _calcular(trabalho, inicio, fim):
+    """
+    Preenche as linhas inicio..fim-1 da matriz de saída.
+    """
+    nucleo, arrays, fontes, D = trabalho
+    fontes = fontes[inicio:fim].tolist()
+    if nucleo == "bfs":
+        indptr_t, indices_t = arrays
+        n = D.shape[1]
+        for ini in range(0, len(fontes), _LARGURA_BITSET):
+            niveis = _bfs_bitset_csr(indptr_t, indices_t, fontes[ini:ini + _LARGURA_BITSET], n)
+            linhas = D[inicio + ini:inicio + ini + len(niveis)]
+            if D.dtype.kind == "f":  # sssp sem pesos: -1 vira inf
+                linhas[...] = np.where(niveis < 0, np.inf, niveis)
+            else:
+                linhas[...] = niveis
+        return
+    indptr, indices, pesos = arrays
+    buscar = _dijkstra_csr if nucleo == "dijkstra" else _spfa_csr
+    for i, s in enumerate(fontes, inicio):
+        D[i] = buscar(indptr, indices, pesos, s)[0]
+
+
+def _preparar_trabalho(nucleo, arrays, fontes, D):
+    if nucleo != "bfs":
+        # os núcleos em Python puro indexam item a item: memoryview evita o
+        # custo dos escalares NumPy sem copiar os arrays (compartilhados)
+        arrays = tuple(memoryview(np.ascontiguousarray(a)) for a in arrays)
+    return nucleo, arrays, fontes, D
+
+
+def _escolher_nucleo(csr, algoritmo):
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo} (use um de {', '.join(ALGORITMOS)})")
+    if algoritmo == "bfs":
+        return "bfs"
+    negativo = csr.ponderado and csr.pesos.size > 0 and csr.pesos.min() < 0
+    if algoritmo == "dijkstra":
+        if negativo:
+            raise ValueError("Dijkstra não aceita pesos negativos")
+        return "dijkstra"
+    if algoritmo == "bellman_ford" or negativo:
+        return "spfa"
+    return "dijkstra" if csr.ponderado else "bfs"
+
+
+# -------------------- memória compartilhada --------------------
+def _publicar(blocos, forma, dtype, conteudo=None):
+    """
+    Cria um bloco de memória compartilhada para um array forma/dtype (guardado
+    em blocos para ser liberado depois), copiando conteudo se dado.
+    Retorna (descritor, view do bloco).
+    """
+    from multiprocessing import shared_memory
+
+    dtype = np.dtype(dtype)
+    tamanho = int(np.prod(forma)) * dtype.itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(1, tamanho))
+    blocos.append(shm)
+    view = np.ndarray(forma, dtype=dtype, buffer=shm.buf)
+    if conteudo is not None:
+        view[...] = conteudo
+    return (shm.name, forma, dtype.str), view
+
+
+def _anexar(descritor):
+    from multiprocessing import shared_memory
+
+    nome, forma, dtype = descritor
+    shm = shared_memory.SharedMemory(name=nome)
+    _SHM_TRABALHO.append(shm)
+    return np.ndarray(forma, dtype=dtype, buffer=shm.buf)
+
+
+def _iniciar_trabalhador(nucleo, descritores, descritor_fontes, descritor_saida):
+    global _TRABALHO
+    arrays = tuple(_anexar(d) for d in descritores)
+    _TRABALHO = _preparar_trabalho(nucleo, arrays, _anexar(descritor_fontes), _anexar(descritor_saida))
+
+
+def _tarefa(intervalo):
+    _calcular(_TRABALHO, *intervalo)
+
+
+# -------------------- execução --------------------
+def distancias_multiplas_origens(G: Grafo, origens=None, algoritmo="sssp", processos=None,
+                                 tamanho_lote=None):
+    """
+    Matriz de distâncias (len(origens), V): linha k a partir de origens[k]
+    (todos os vértices, por padrão), colunas na ordem de G.csr().vertices.
+    algoritmo:
+      - "bfs": distâncias em arestas, int32 com -1 para inalcançáveis (como
+               bfs_multiplas_fontes), 64 origens por passada com bitsets
+      - "dijkstra": float64 com inf; ValueError se há pesos negativos
+      - "bellman_ford": float64 com inf, via spfa (ValueError se há ciclo
+                        negativo alcançável)
+      - "sssp": escolhe pelo grafo: BFS sem pesos, spfa com pesos negativos e
+                Dijkstra nos demais casos (float64 com inf)
+    processos > 1 distribui lotes de tamanho_lote origens num pool que lê o
+    grafo e escreve a matriz em memória compartilhada.
+    """
+    csr = G.csr()
+    n = csr.num_vertices()
+    nucleo = _escolher_nucleo(csr, algoritmo)
+    if origens is None:
+        fontes = np.arange(n, dtype=np.int64)
+    else:
+        try:
+            fontes = np.array([csr.indice(v) for v in origens], dtype=np.int64)
+        except KeyError as erro:
+            raise ValueError(f"Vértice {erro.args[0]!r} não existe")
+
+    if nucleo == "bfs":
+        t = csr.transposta()
+        arrays = (t.indptr, t.indices)
+    else:
+        pesos = csr.pesos if csr.ponderado else np.ones(csr.indices.size, dtype=np.int64)
+        arrays = (csr.indptr, csr.indices, pesos)
+    tipo = np.int32 if algoritmo == "bfs" else np.float64
+    forma = (fontes.size, n)
+
+    if tamanho_lote is None:
+        if nucleo == "bfs":
+            tamanho_lote = _LARGURA_BITSET
+        else:
+            tamanho_lote = max(1, fontes.size // (4 * processos)) if processos else fontes.size
+    tamanho_lote = max(1, int(tamanho_lote))
+    intervalos = [(ini, min(ini + tamanho_lote, fontes.size))
+                  for ini in range(0, fontes.size, tamanho_lote)]
+    contar("execucao_lote.origens", int(fontes.size))
+    contar("execucao_lote.lotes", len(intervalos))
+
+    if not processos or processos <= 1:
+        D = np.empty(forma, dtype=tipo)
+        trabalho = _preparar_trabalho(nucleo, arrays, fontes, D)
+        with fase("execucao_lote.calculo"):
+            for ini, fim in intervalos:
+                _calcular(trabalho, ini, fim)
+        return D
+
+    from multiprocessing import Pool
+
+    blocos = []
+    D = None
+    try:
+        with fase("execucao_lote.publicacao"):
+            descritores = tuple(_publicar(blocos, a.shape, a.dtype, a)[0] for a in arrays)
+            descritor_fontes = _publicar(blocos, fontes.shape, fontes.dtype, fontes)[0]
+            descritor_saida, D = _publicar(blocos, forma, tipo)
+        with fase("execucao_lote.calculo"):
+            with Pool(processos, initializer=_iniciar_trabalhador,
+                      initargs=(nucleo, descritores, descritor_fontes, descritor_saida)) as pool:
+                for _ in pool.imap_unordered(_tarefa, intervalos):
+                    pass
+        return D.copy()
+    finally:
+        D = None  # a view precisa sumir antes de fechar o bloco
+        for shm in blocos:
+            shm.close()
+            shm.unlink()
+
+
+if __name__ == "__main__":
+    import time
+    from .geradores import erdos_renyi
+
+    G = erdos_renyi(2000, grau_medio=8, ponderado=True, semente=0)
+    for processos in (None, 4):
+        inicio = time.perf_counter()
+        D = distancias_multiplas_origens(G, processos=processos)
+        print(f"processos={processos}: {time.perf_counter() - inicio:.2f}s, "
+              f"soma das distâncias finitas {D[np.isfinite(D)].sum():.0f}")
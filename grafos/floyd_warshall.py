@@ -0,0 +1,226 @@
+import numpy as np
+
+from .grafo_utils import Grafo
+from .instrumentacao import ativo, contar, fase, registrar_serie
+
+
+def floyd_warshall_matricial(grafo: Grafo):
+    """
+    Floyd-Warshall vetorizado: cada passo k é um np.minimum em broadcast.
+    Retorna (D, P) como arrays V x V, com índices na ordem de grafo.vertices:
+      D[i, j] -> distância mínima de i a j (inf se inalcançável)
+      P[i, j] -> índice do predecessor de j no caminho mínimo de i a j (-1 se não há)
+    Laços só entram na diagonal quando negativos.
+    """
+    csr = grafo.csr()
+    n = csr.num_vertices()
+    src, dst = csr.origens(), csr.indices
+    pesos = csr.pesos if csr.ponderado else np.ones(dst.size)
+
+    D = np.full((n, n), np.inf)
+    P = np.full((n, n), -1, dtype=csr.indices.dtype)
+    D[src, dst] = pesos
+    P[src, dst] = src
+    diagonal = np.diagonal(D).copy()
+    np.fill_diagonal(D, np.minimum(diagonal, 0))
+    np.fill_diagonal(P, np.where(diagonal < 0, np.arange(n), -1))
+
+    candidato = np.empty((n, n))
+    melhor = np.empty((n, n), dtype=bool)
+    melhorias = [] if ativo() else None
+    with fase("floyd_warshall.iteracoes"):
+        for k in range(n):
+            np.add(D[:, k, None], D[None, k, :], out=candidato)
+            np.less(candidato, D, out=melhor)
+            if melhorias is not None:
+                melhorias.append(int(np.count_nonzero(melhor)))
+            np.copyto(P, P[k].copy(), where=melhor)
+            np.minimum(D, candidato, out=D)
+    if melhorias is not None:
+        registrar_serie("floyd_warshall.melhorias_por_k", melhorias)
+        contar("floyd_warshall.melhorias", sum(melhorias))
+
+    if np.any(np.diagonal(D) < 0):
+        raise ValueError("Ciclo de peso negativo detectado!")
+    return D, P
+
+
+def floyd_warshall(grafo: Grafo):
+    """
+    Retorna (A, pi) como dicionários:
+      A[(v, w)]  -> distância mínima de v a w
+      pi[(v, w)] -> predecessor de w no caminho mínimo de v a w (None se não há)
+    """
+    D, P = floyd_warshall_matricial(grafo)
+    csr = grafo.csr()
+    vertices = csr.vertices
+    inteiro = not csr.ponderado or csr.pesos.dtype.kind in "iu"
+
+    A = {}
+    pi = {}
+    for i, (linha_d, linha_p) in enumerate(zip(D.tolist(), P.tolist())):
+        v = vertices[i]
+        for j, w in enumerate(vertices):
+            d = linha_d[j]
+            A[(v, w)] = int(d) if inteiro and d != float('inf') else d
+            pi[(v, w)] = vertices[linha_p[j]] if linha_p[j] >= 0 else None
+    return A, pi
+
+
+# -------------------- versão em blocos (tiles) --------------------
+_D_TRABALHO = None
+_SHM_TRABALHO = None
+
+
+def _atualizar_bloco(D, ib, jb, kb, b):
+    """
+    Relaxa o bloco (ib, jb) usando os intermediários do bloco kb, em ordem de k.
+    Trabalha sobre views de D, então vale também para blocos sobrepostos
+    (fases 1 e 2) e para D em memória compartilhada ou memmap.
+    """
+    n = D.shape[0]
+    I = slice(ib * b, min(n, (ib + 1) * b))
+    J = slice(jb * b, min(n, (jb + 1) * b))
+    C = D[I, J]
+    for k in range(kb * b, min(n, (kb + 1) * b)):
+        np.minimum(C, D[I, k, None] + D[None, k, J], out=C)
+
+
+def _iniciar_trabalhador(nome, forma, dtype, arquivo):
+    global _D_TRABALHO, _SHM_TRABALHO
+    if arquivo is not None:
+        _D_TRABALHO = np.load(arquivo, mmap_mode="r+")
+    else:
+        from multiprocessing import shared_memory
+        _SHM_TRABALHO = shared_memory.SharedMemory(name=nome)
+        _D_TRABALHO = np.ndarray(forma, dtype=dtype, buffer=_SHM_TRABALHO.buf)
+
+
+def _tarefa_bloco(args):
+    _atualizar_bloco(_D_TRABALHO, *args)
+
+
+def floyd_warshall_blocado(grafo: Grafo, tamanho_bloco=256, processos=None, arquivo=None,
+                           dtype=np.float64):
+    """
+    Floyd-Warshall em blocos de tamanho_bloco x tamanho_bloco (cabem na cache).
+    Em cada rodada kb: (1) bloco diagonal; (2) blocos da linha e coluna kb;
+    (3) demais blocos. Os blocos das fases 2 e 3 são independentes e, com
+    processos > 1, são distribuídos num pool que enxerga D em memória
+    compartilhada (ou no memmap, se arquivo for dado).
+
+    arquivo: caminho de um .npy onde D é gravada via memmap, para V grande.
+    dtype: np.float32 reduz a memória pela metade.
+    Retorna apenas a matriz de distâncias D (índices na ordem de grafo.vertices).
+    """
+    csr = grafo.csr()
+    n = csr.num_vertices()
+    src, dst = csr.origens(), csr.indices
+    pesos = csr.pesos if csr.ponderado else np.ones(dst.size)
+
+    shm = None
+    if arquivo is not None:
+        D = np.lib.format.open_memmap(arquivo, mode="w+", dtype=dtype, shape=(n, n))
+    elif processos and processos > 1:
+        from multiprocessing import shared_memory
+        shm = shared_memory.SharedMemory(create=True, size=max(1, n * n * np.dtype(dtype).itemsize))
+        D = np.ndarray((n, n), dtype=dtype, buffer=shm.buf)
+    else:
+        D = np.empty((n, n), dtype=dtype)
+
+    try:
+        D[...] = np.inf
+        D[src, dst] = pesos
+        np.fill_diagonal(D, np.minimum(np.diagonal(D), 0))
+
+        b = max(1, int(tamanho_bloco))
+        nb = (n + b - 1) // b
+        pool = None
+        if processos and processos > 1:
+            from multiprocessing import Pool
+            if arquivo is not None:
+                D.flush()
+            pool = Pool(processos, initializer=_iniciar_trabalhador,
+                        initargs=(shm.name if shm else None, (n, n), dtype, arquivo))
+        contar("floyd_warshall_blocado.rodadas", nb)
+        contar("floyd_warshall_blocado.blocos", nb * nb * nb)
+        try:
+            for kb in range(nb):
+                _atualizar_bloco(D, kb, kb, kb, b)
+                fase2 = [(kb, j, kb, b) for j in range(nb) if j != kb] + \
+                        [(i, kb, kb, b) for i in range(nb) if i != kb]
+                fase3 = [(i, j, kb, b) for i in range(nb) if i != kb for j in range(nb) if j != kb]
+                for nome_fase, tarefas in (("fase2", fase2), ("fase3", fase3)):
+                    with fase(f"floyd_warshall_blocado.{nome_fase}"):
+                        if pool is not None:
+                            pool.map(_tarefa_bloco, tarefas)
+                        else:
+                            for t in tarefas:
+                                _atualizar_bloco(D, *t)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        if np.any(np.diagonal(D) < 0):
+            raise ValueError("Ciclo de peso negativo detectado!")
+        if shm is not None:
+            D = D.copy()
+        elif arquivo is not None:
+            D.flush()
+        return D
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+
+def reconstruir_caminho(P, vertices, origem, destino):
+    """
+    Usa a matriz de predecessores P para montar o caminho mínimo de origem a
+    destino como lista de labels ([] se destino é inalcançável).
+    vertices deve estar na mesma ordem usada para gerar P.
+    """
+    idx = {v: i for i, v in enumerate(vertices)}
+    i, j = idx[origem], idx[destino]
+    if i == j:
+        return [origem]
+    if P[i, j] < 0:
+        return []
+    caminho = [j]
+    while j != i:
+        j = int(P[i, j])
+        caminho.append(j)
+        if len(caminho) > len(vertices):
+            raise ValueError("Predecessores formam um ciclo")
+    return [vertices[k] for k in reversed(caminho)]
+
+
+if __name__ == "__main__":
+    # Supondo que a classe 'Grafo' já esteja definida em seu ambiente
+
+    print("Criação do Grafo da Imagem")
+    grafo_imagem = Grafo(vertices=['1', '2', '3'],
+                        arestas={('1', '1'): 2, 
+                                ('1', '2'): 8, 
+                                ('2', '1'): 3,
+                                ('1', '3'): 5,
+                                ('3', '2'): 2},
+                        direcionado=True, 
+                        ponderado=True)
+
+    # Exibindo informações do grafo criado para verificação
+    print("Arestas do grafo criado: ", grafo_imagem.arestas)
+    grafo_imagem.printar_grafo()
+    print("\nLista de adjacência (ponderada):", grafo_imagem.lista_adjacencias(ponderada=True))
+    # print("\nMatriz de adjacência (ponderada):")
+    # for linha in grafo_imagem.matriz_de_adjacencias(ponderada=True, default=0):
+    #     print(linha)
+
+    A, pi = floyd_warshall(grafo=grafo_imagem)
+
+    print(A)
+
+    D, P = floyd_warshall_matricial(grafo_imagem)
+    print("Caminho 1 -> 2:", reconstruir_caminho(P, grafo_imagem.vertices, '1', '2'))
+
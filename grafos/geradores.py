@@ -0,0 +1,147 @@
+# Geradores de grafos sintéticos, reprodutíveis pela semente
+# 1. Erdős–Rényi G(n, p), grade retangular e livre de escala (Barabási–Albert)
+# 2. Euleriano aleatório (união de ciclos disjuntos em arestas sobre um ciclo
+#    hamiltoniano, então é conexo e todo vértice tem grau par / entrada = saída)
+# 3. Completo ponderado (para caixeiro viajante e Floyd-Warshall)
+# Todos retornam um Grafo com vértices 0..n-1; com ponderado=True os pesos são
+# inteiros sorteados em [peso_min, peso_max].
+
+import numpy as np
+
+from .grafo_utils import Grafo
+
+
+def _montar(n, src, dst, direcionado, ponderado, rng, peso_min, peso_max):
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    if not ponderado:
+        return Grafo(list(range(n)), list(zip(src.tolist(), dst.tolist())), direcionado, False)
+    pesos = rng.integers(peso_min, peso_max + 1, size=src.size)
+    return Grafo(list(range(n)), list(zip(src.tolist(), dst.tolist(), pesos.tolist())),
+                 direcionado, True)
+
+
+def _sem_repetidas(src, dst, direcionado):
+    """
+    Remove laços e pares repetidos (em não direcionado, (u, v) e (v, u) contam
+    como o mesmo par), mantendo a primeira ocorrência.
+    """
+    manter = src != dst
+    src, dst = src[manter], dst[manter]
+    a, b = (src, dst) if direcionado else (np.minimum(src, dst), np.maximum(src, dst))
+    _, primeiras = np.unique(a * (int(max(a.max(initial=0), b.max(initial=0))) + 1) + b,
+                             return_index=True)
+    primeiras.sort()
+    return src[primeiras], dst[primeiras]
+
+
+# -------------------- modelos aleatórios --------------------
+def erdos_renyi(n, p=None, grau_medio=None, direcionado=False, ponderado=False, semente=0,
+                peso_min=1, peso_max=10):
+    """
+    G(n, p) sem laços: o número de arestas é sorteado da binomial e os pares
+    são sorteados uniformemente (os repetidos são descartados, o que é
+    desprezível para grafos esparsos). Informe p ou grau_medio.
+    """
+    if (p is None) == (grau_medio is None):
+        raise ValueError("Informe p ou grau_medio")
+    rng = np.random.default_rng(semente)
+    pares = n * (n - 1) if direcionado else n * (n - 1) // 2
+    if p is None:
+        p = min(1.0, grau_medio / max(n - 1, 1))
+    m = int(rng.binomial(pares, p)) if pares else 0
+    src = rng.integers(0, max(n, 1), size=m)
+    dst = rng.integers(0, max(n, 1), size=m)
+    src, dst = _sem_repetidas(src, dst, direcionado)
+    return _montar(n, src, dst, direcionado, ponderado, rng, peso_min, peso_max)
+
+
+def grade(linhas, colunas, direcionado=False, ponderado=False, semente=0, peso_min=1, peso_max=10):
+    """
+    Grade linhas x colunas com vizinhança de 4; o vértice (i, j) é i * colunas + j.
+    Direcionada, os arcos vão para a direita e para baixo.
+    """
+    rng = np.random.default_rng(semente)
+    ids = np.arange(linhas * colunas).reshape(linhas, colunas)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return _montar(linhas * colunas, src, dst, direcionado, ponderado, rng, peso_min, peso_max)
+
+
+def livre_de_escala(n, m=2, direcionado=False, ponderado=False, semente=0, peso_min=1, peso_max=10):
+    """
+    Barabási–Albert: cada vértice novo liga-se a m vértices anteriores
+    escolhidos com probabilidade proporcional ao grau. Direcionado, os arcos
+    vão do vértice novo para os antigos.
+    """
+    if m < 1 or n <= m:
+        raise ValueError("Use 1 <= m < n")
+    rng = np.random.default_rng(semente)
+    repetidos = list(range(m))  # cada vértice aparece uma vez por aresta incidente
+    src, dst = [], []
+    for novo in range(m, n):
+        alvos = set()
+        while len(alvos) < m:
+            alvos.add(repetidos[int(rng.integers(len(repetidos)))])
+        for alvo in sorted(alvos):
+            src.append(novo)
+            dst.append(alvo)
+            repetidos.append(alvo)
+        repetidos.extend([novo] * m)
+    return _montar(n, src, dst, direcionado, ponderado, rng, peso_min, peso_max)
+
+
+def euleriano_aleatorio(n, ciclos_extras=None, direcionado=False, ponderado=False, semente=0,
+                        peso_min=1, peso_max=10):
+    """
+    Grafo euleriano conexo: um ciclo hamiltoniano aleatório mais ciclos_extras
+    (padrão n // 2) ciclos curtos sem arestas em comum com os já escolhidos.
+    """
+    if n < 3:
+        raise ValueError("Use n >= 3")
+    rng = np.random.default_rng(semente)
+    if ciclos_extras is None:
+        ciclos_extras = n // 2
+
+    usadas = set()
+    src, dst = [], []
+
+    def chave(u, v):
+        return (u, v) if direcionado or u < v else (v, u)
+
+    def adicionar_ciclo(ciclo):
+        arestas = [chave(ciclo[i], ciclo[(i + 1) % len(ciclo)]) for i in range(len(ciclo))]
+        if len(set(arestas)) < len(arestas) or any(a in usadas for a in arestas):
+            return False
+        for i in range(len(ciclo)):
+            src.append(ciclo[i])
+            dst.append(ciclo[(i + 1) % len(ciclo)])
+        usadas.update(arestas)
+        return True
+
+    adicionar_ciclo(rng.permutation(n).tolist())
+    tentativas = 0
+    while ciclos_extras > 0 and tentativas < 100 * n:
+        tentativas += 1
+        tamanho = int(rng.integers(3, min(n, 6) + 1))
+        if adicionar_ciclo(rng.choice(n, size=tamanho, replace=False).tolist()):
+            ciclos_extras -= 1
+    return _montar(n, src, dst, direcionado, ponderado, rng, peso_min, peso_max)
+
+
+def completo_ponderado(n, direcionado=False, semente=0, peso_min=1, peso_max=100, euclidiano=False):
+    """
+    Grafo completo ponderado. euclidiano=True usa a distância entre n pontos
+    sorteados no quadrado unitário (pesos float, desigualdade triangular vale).
+    """
+    rng = np.random.default_rng(semente)
+    if direcionado:
+        src, dst = np.nonzero(~np.eye(n, dtype=bool))
+    else:
+        src, dst = np.triu_indices(n, k=1)
+    if not euclidiano:
+        return _montar(n, src, dst, direcionado, True, rng, peso_min, peso_max)
+    pontos = rng.random((n, 2))
+    pesos = np.hypot(*(pontos[src] - pontos[dst]).T)
+    return Grafo(list(range(n)), list(zip(src.tolist(), dst.tolist(), pesos.tolist())),
+                 direcionado, True)
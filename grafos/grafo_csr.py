@@ -0,0 +1,460 @@
+import numpy as np
+
+
+class GrafoCSR:
+    def __init__(self, vertices: list, arestas, direcionado=True, ponderado=False):
+        """
+        Versão compacta do Grafo: os labels são convertidos em índices inteiros
+        (0..n-1) e as adjacências ficam em arrays NumPy no formato CSR:
+            indptr  -> vizinhos de i estão em indices[indptr[i]:indptr[i+1]]
+            indices -> destino de cada arco (ordenados dentro de cada vértice)
+            pesos   -> peso de cada arco (None se ponderado=False)
+
+        Aceita as mesmas entradas do Grafo. Arestas repetidas são armazenadas uma
+        única vez (em grafo ponderado vale o último peso informado, como no dict).
+        """
+        self.direcionado = direcionado
+        self.ponderado = ponderado
+        self._definir_vertices(vertices)
+
+        src, dst, pesos = self._validar_entrada_arestas(arestas)
+        if not direcionado:
+            src, dst, pesos = self._espelhar(src, dst, pesos)
+        self._montar(src, dst, pesos)
+
+    @classmethod
+    def de_grafo(cls, G):
+        """
+        Constrói a versão CSR de um Grafo já existente (os arcos de G já estão
+        duplicados quando ele é não direcionado).
+        """
+        csr = cls.__new__(cls)
+        csr.direcionado = G.direcionado
+        csr.ponderado = G.ponderado
+        csr._definir_vertices(G.vertices)
+        idx = csr._indice
+        src, dst, pesos = [], [], []
+        for (u, v, w) in G._iter_arcos_pesos():
+            src.append(idx[u])
+            dst.append(idx[v])
+            pesos.append(w)
+        csr._montar(src, dst, pesos if G.ponderado else None)
+        return csr
+
+    @classmethod
+    def de_arrays(cls, vertices, indptr, indices, pesos=None, direcionado=True, ponderado=False):
+        """
+        Constrói o GrafoCSR direto de arrays já no formato CSR (indices ordenados
+        dentro de cada vértice, sem repetidos; não direcionado já espelhado).
+        Os arrays não são copiados, então podem vir de np.load(mmap_mode='r');
+        nesse caso, só adicionar_vertice/adicionar_aresta criam cópias em memória.
+        """
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if indptr.ndim != 1 or indptr.size != len(vertices) + 1:
+            raise ValueError("indptr deve ter um elemento a mais que o número de vértices")
+        if indptr[-1] != indices.size:
+            raise ValueError("indptr[-1] deve ser igual ao número de arcos")
+        if ponderado and (pesos is None or len(pesos) != indices.size):
+            raise ValueError("Em grafo ponderado, pesos deve ter um valor por arco")
+        csr = cls.__new__(cls)
+        csr.direcionado = direcionado
+        csr.ponderado = ponderado
+        csr._definir_vertices(vertices)
+        if len(csr._labels) != len(vertices):
+            raise ValueError("Labels dos vértices repetidos")
+        csr.indptr = indptr
+        csr.indices = indices
+        csr.pesos = np.asarray(pesos) if ponderado else None
+        csr._invalidar_caches()
+        return csr
+
+    # -------------------- validações internas --------------------
+    def _definir_vertices(self, vertices):
+        self._labels = []
+        self._indice = {}
+        for v in vertices:
+            if not isinstance(v, (str, int)):
+                raise ValueError("Os labels dos vértices devem ser inteiros ou strings")
+            if v not in self._indice:
+                self._indice[v] = len(self._labels)
+                self._labels.append(v)
+
+    def _validar_entrada_arestas(self, arestas):
+        if not self.ponderado:
+            if not isinstance(arestas, list):
+                raise ValueError("Para grafo não ponderado, arestas deve ser uma lista de (u, v)")
+            itens = arestas
+        elif isinstance(arestas, dict):
+            itens = []
+            for aresta, valor in arestas.items():
+                if not isinstance(aresta, tuple) or len(aresta) != 2:
+                    raise ValueError("Chaves do dicionário devem ser tuplas (u, v)")
+                itens.append((aresta[0], aresta[1], valor))
+        elif isinstance(arestas, list):
+            itens = arestas
+        else:
+            raise ValueError("Para grafo ponderado, forneça dict {(u,v): peso} ou lista [(u,v,peso)]")
+
+        tam = 3 if self.ponderado else 2
+        idx = self._indice
+        src, dst, pesos = [], [], []
+        for aresta in itens:
+            if not isinstance(aresta, tuple) or len(aresta) != tam:
+                if self.ponderado:
+                    raise ValueError("Em grafo ponderado, use tuplas (u, v, peso)")
+                raise ValueError("Arestas devem ser tuplas (u, v) para grafo não ponderado")
+            u, v = aresta[0], aresta[1]
+            if u not in idx or v not in idx:
+                raise ValueError(f"Aresta {aresta} contém vértices não existentes")
+            if self.ponderado:
+                if not isinstance(aresta[2], (int, float)):
+                    raise ValueError("Pesos das arestas devem ser numéricos")
+                pesos.append(aresta[2])
+            src.append(idx[u])
+            dst.append(idx[v])
+        return src, dst, (pesos if self.ponderado else None)
+
+    @staticmethod
+    def _espelhar(src, dst, pesos):
+        """
+        Intercala (u, v) e (v, u) preservando a ordem de entrada das arestas.
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        s2 = np.empty(2 * src.size, dtype=np.int64)
+        d2 = np.empty(2 * src.size, dtype=np.int64)
+        s2[0::2], s2[1::2] = src, dst
+        d2[0::2], d2[1::2] = dst, src
+        if pesos is not None:
+            pesos = np.repeat(np.asarray(pesos), 2)
+        return s2, d2, pesos
+
+    def _montar(self, src, dst, pesos):
+        """
+        Ordena os arcos por (origem, destino), remove repetidos (fica o último)
+        e gera indptr/indices/pesos.
+        """
+        n = len(self._labels)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if pesos is not None:
+            pesos = np.asarray(pesos)
+            if pesos.dtype == object or pesos.size == 0:
+                pesos = pesos.astype(np.float64)
+
+        if src.size:
+            ordem = np.lexsort((dst, src))  # estável: repetidos mantêm a ordem de entrada
+            src, dst = src[ordem], dst[ordem]
+            ultimo = np.ones(src.size, dtype=bool)
+            ultimo[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst = src[ultimo], dst[ultimo]
+            if pesos is not None:
+                pesos = pesos[ordem][ultimo]
+
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=self.indptr[1:])
+        self.indices = dst.astype(self._tipo_indice(n))
+        self.pesos = pesos
+        self._invalidar_caches()
+
+    def _invalidar_caches(self):
+        self._cache_grau_entrada = None
+        self._cache_transposta = None
+
+    @staticmethod
+    def _tipo_indice(n):
+        return np.int32 if n < 2 ** 31 else np.int64
+
+    # -------------------- acesso por índice --------------------
+    @property
+    def vertices(self):
+        return self._labels
+
+    @property
+    def arestas(self):
+        """
+        Materializa as arestas no formato do Grafo (lista ou dict). Custa O(E);
+        prefira indptr/indices/pesos em código sensível a desempenho.
+        """
+        if not self.ponderado:
+            return list(self._iter_arcos())
+        return {(u, v): w for (u, v, w) in self._iter_arcos_pesos()}
+
+    def num_vertices(self):
+        return len(self._labels)
+
+    def num_arcos(self):
+        return int(self.indices.size)
+
+    def indice(self, v):
+        return self._indice[v]
+
+    def label(self, i):
+        return self._labels[i]
+
+    def vizinhos(self, v):
+        """
+        Índices dos vizinhos de v (view do array, sem cópia).
+        """
+        i = self._indice[v]
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def origens(self):
+        """
+        Índice de origem de cada arco (mesmo tamanho de indices).
+        """
+        return np.repeat(np.arange(len(self._labels), dtype=self.indices.dtype), np.diff(self.indptr))
+
+    def _posicao_arco(self, i, j):
+        ini, fim = self.indptr[i], self.indptr[i + 1]
+        pos = ini + int(np.searchsorted(self.indices[ini:fim], j))
+        if pos < fim and self.indices[pos] == j:
+            return pos
+        return None
+
+    # -------------------- impressão --------------------
+    def printar_grafo(self):
+        print(f"G = (V = [{', '.join(map(str, self._labels))}], A = [", end="")
+        if not self.ponderado:
+            print(", ".join(f"{a}" for a in self._iter_arcos()), end="")
+        else:
+            print(", ".join(f"{(u, v)}: {w}" for (u, v, w) in self._iter_arcos_pesos()), end="")
+        print("])")
+
+    # -------------------- utilitários internos --------------------
+    def _iter_arcos(self):
+        labels = self._labels
+        for u, v in zip(self.origens().tolist(), self.indices.tolist()):
+            yield (labels[u], labels[v])
+
+    def _iter_arcos_pesos(self):
+        labels = self._labels
+        pesos = self.pesos.tolist() if self.ponderado else [1] * self.indices.size
+        for u, v, w in zip(self.origens().tolist(), self.indices.tolist(), pesos):
+            yield (labels[u], labels[v], w)
+
+    # -------------------- graus --------------------
+    def _graus_entrada(self):
+        if self._cache_grau_entrada is None:
+            self._cache_grau_entrada = np.bincount(self.indices, minlength=len(self._labels))
+        return self._cache_grau_entrada
+
+    def _graus_saida(self):
+        return np.diff(self.indptr)
+
+    def grau_entrada_dos_vertices(self):
+        return dict(zip(self._labels, self._graus_entrada().tolist()))
+
+    def grau_saida_dos_vertices(self):
+        return dict(zip(self._labels, self._graus_saida().tolist()))
+
+    def graus_de_um_vertice(self, v):
+        if v not in self._indice:
+            return 0, 0
+        i = self._indice[v]
+        entrada = int(self._graus_entrada()[i])
+        saida = int(self.indptr[i + 1] - self.indptr[i])
+        return entrada, saida
+
+    # -------------------- consultas --------------------
+    def verificar_aresta(self, aresta):
+        if not isinstance(aresta, tuple) or len(aresta) not in (2, 3):
+            return False
+        if len(aresta) == 3 and not self.ponderado:
+            return False
+        u, v = aresta[0], aresta[1]
+        if u not in self._indice or v not in self._indice:
+            return False
+        pos = self._posicao_arco(self._indice[u], self._indice[v])
+        if pos is None:
+            return False
+        if len(aresta) == 3:
+            return self.pesos[pos] == aresta[2]
+        return True
+
+    def verificar_vertice(self, v):
+        return v in self._indice
+
+    def vertice_isolado(self, v):
+        if v not in self._indice:
+            return True
+        i = self._indice[v]
+        return self.indptr[i + 1] == self.indptr[i] and self._graus_entrada()[i] == 0
+
+    # -------------------- modificações --------------------
+    def adicionar_vertice(self, v):
+        if not isinstance(v, (str, int, float)):
+            raise ValueError("Vértice a adicionar deve ser string ou numérico")
+        if v in self._indice:
+            return
+        self._indice[v] = len(self._labels)
+        self._labels.append(v)
+        self.indptr = np.append(self.indptr, self.indptr[-1])
+        self.indices = self.indices.astype(self._tipo_indice(len(self._labels)), copy=False)
+        self._invalidar_caches()
+
+    def adicionar_aresta(self, u, v, peso=None):
+        """
+        Insere o arco mantendo a ordenação do CSR. Custa O(E) por chamada
+        (os arrays são realocados); para muitas arestas, reconstrua o grafo.
+        """
+        if u not in self._indice or v not in self._indice:
+            raise ValueError("Vértices não existem")
+        if not self.ponderado:
+            if peso is not None:
+                raise ValueError("Este grafo não é ponderado; não informe peso")
+        elif not isinstance(peso, (int, float)):
+            raise ValueError("Peso numérico é obrigatório para grafo ponderado")
+
+        i, j = self._indice[u], self._indice[v]
+        self._inserir_arco(i, j, peso)
+        if not self.direcionado:
+            self._inserir_arco(j, i, peso)
+
+    def _inserir_arco(self, i, j, peso):
+        # snapshot mapeado somente leitura: cada array é copiado antes da
+        # primeira escrita (adicionar_vertice pode já ter copiado só indptr)
+        if not self.indptr.flags.writeable:
+            self.indptr = np.array(self.indptr)
+        if not self.indices.flags.writeable:
+            self.indices = np.array(self.indices)
+        if self.ponderado and not self.pesos.flags.writeable:
+            self.pesos = np.array(self.pesos)
+        if self.ponderado and isinstance(peso, float) and self.pesos.dtype.kind != "f":
+            self.pesos = self.pesos.astype(np.float64)
+        pos = self._posicao_arco(i, j)
+        if pos is not None:
+            if self.ponderado:
+                self.pesos[pos] = peso
+            return
+        ini, fim = self.indptr[i], self.indptr[i + 1]
+        pos = ini + int(np.searchsorted(self.indices[ini:fim], j))
+        self.indices = np.insert(self.indices, pos, j)
+        if self.ponderado:
+            self.pesos = np.insert(self.pesos, pos, peso)
+        self.indptr[i + 1:] += 1
+        self._invalidar_caches()
+
+    # -------------------- representações --------------------
+    def lista_adjacencias(self, ponderada=False, ordenada=False):
+        """
+        Mesmo formato de Grafo.lista_adjacencias. Os vizinhos saem na ordem dos
+        índices; ordenada=True os ordena pelos labels, como no Grafo.
+        """
+        labels = self._labels
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        lista = {}
+        if not ponderada:
+            for i, v in enumerate(labels):
+                lista[v] = [labels[j] for j in indices[indptr[i]:indptr[i + 1]]]
+        else:
+            pesos = self.pesos.tolist() if self.ponderado else [1] * len(indices)
+            for i, v in enumerate(labels):
+                ini, fim = indptr[i], indptr[i + 1]
+                lista[v] = [(labels[j], w) for j, w in zip(indices[ini:fim], pesos[ini:fim])]
+        if ordenada:
+            for adj in lista.values():
+                adj.sort()
+        return lista
+
+    def matriz_de_adjacencias(self, ponderada=False, default=0):
+        return self.matriz_numpy(ponderada, default).tolist()
+
+    def _dados(self, ponderada, dtype):
+        if ponderada and self.ponderado:
+            return self.pesos.astype(dtype or self.pesos.dtype, copy=False)
+        return np.ones(self.indices.size, dtype=dtype or np.int8)
+
+    def matriz_numpy(self, ponderada=False, default=0, dtype=None):
+        """
+        Matriz de adjacência densa como um único array V x V contíguo (a lista
+        de listas de matriz_de_adjacencias gasta várias vezes mais memória).
+        dtype: padrão int para 0/1 e o tipo dos pesos (promovido com default)
+        para ponderada=True.
+        """
+        tam = len(self._labels)
+        if not ponderada:
+            matriz = np.zeros((tam, tam), dtype=dtype or int)
+            matriz[self.origens(), self.indices] = 1
+        else:
+            pesos = self._dados(True, None)
+            if dtype is None:
+                dtype = np.result_type(pesos, type(default))
+            matriz = np.full((tam, tam), default, dtype=dtype)
+            matriz[self.origens(), self.indices] = pesos
+        return matriz
+
+    def matriz_esparsa(self, formato="csr", ponderada=False, dtype=None, usar_scipy=None):
+        """
+        Matriz de adjacência esparsa, sem materializar V x V.
+        formato: "csr" ou "coo". Valores: 1 (dtype int8 por padrão) ou os pesos
+        se ponderada=True.
+        usar_scipy: None usa scipy.sparse se estiver instalado; False força arrays.
+        Sem scipy, retorna arrays NumPy: (dados, indices, indptr) para "csr" e
+        (dados, (linhas, colunas)) para "coo", na ordem aceita pelos construtores
+        de scipy.sparse.
+        """
+        if formato not in ("csr", "coo"):
+            raise ValueError('formato deve ser "csr" ou "coo"')
+        dados = self._dados(ponderada, dtype)
+        tam = len(self._labels)
+        sparse = None
+        if usar_scipy is not False:
+            try:
+                from scipy import sparse
+            except ImportError:
+                if usar_scipy:
+                    raise
+        if formato == "csr":
+            if sparse is not None:
+                return sparse.csr_matrix((dados, self.indices, self.indptr), shape=(tam, tam))
+            return dados, self.indices, self.indptr
+        if sparse is not None:
+            return sparse.coo_matrix((dados, (self.origens(), self.indices)), shape=(tam, tam))
+        return dados, (self.origens(), self.indices)
+
+    def csr(self):
+        return self
+
+    def para_grafo(self):
+        """
+        Grafo (listas/dicts) equivalente, para os algoritmos que usam a API do
+        Grafo. Em não direcionado cada aresta é passada uma vez (o Grafo espelha).
+        """
+        from .grafo_utils import Grafo
+        src, dst = self.origens(), self.indices
+        pesos = self.pesos
+        if not self.direcionado:
+            manter = src <= dst
+            src, dst = src[manter], dst[manter]
+            if pesos is not None:
+                pesos = pesos[manter]
+        labels = self._labels
+        us = [labels[i] for i in src.tolist()]
+        vs = [labels[j] for j in dst.tolist()]
+        arestas = list(zip(us, vs, pesos.tolist())) if self.ponderado else list(zip(us, vs))
+        return Grafo(list(labels), arestas, self.direcionado, self.ponderado)
+
+    def transposta(self):
+        """
+        GrafoCSR com os arcos invertidos (vizinhos de entrada), em cache até a
+        próxima modificação. Para grafo não direcionado é o próprio grafo.
+        """
+        if not self.direcionado:
+            return self
+        if self._cache_transposta is None:
+            t = GrafoCSR.__new__(GrafoCSR)
+            t.direcionado = True
+            t.ponderado = self.ponderado
+            t._labels = list(self._labels)
+            t._indice = dict(self._indice)
+            t._montar(self.indices, self.origens(), self.pesos)
+            self._cache_transposta = t
+        return self._cache_transposta
+
+    # -------------------- conectividade --------------------
+    def conexo_por_mm(self, m=None, ignorar_indices=None):
+        from .conectividade import conexo
+        return conexo(self, m=m, ignorar_indices=ignorar_indices)
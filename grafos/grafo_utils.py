@@ -0,0 +1,638 @@
+import weakref
+from bisect import insort
+
+class Grafo:
+    def __init__(self, vertices: list, arestas, direcionado=True, ponderado=False, espelhar=True):
+        """
+        vertices: lista de labels (str/int)
+        arestas:
+            - se ponderado=False: lista de tuplas (u, v)
+            - se ponderado=True:
+                * dict { (u, v): peso }  OU
+                * lista de tuplas (u, v, peso)
+        direcionado: True/False
+        ponderado: True/False
+        espelhar: em grafo não direcionado, guarda (u, v) e (v, u) em arestas
+                  (padrão); False guarda cada aresta uma única vez, com metade
+                  da memória. Os algoritmos enxergam os dois sentidos pelos
+                  métodos _iter_arcos/_iter_arcos_pesos/verificar_aresta.
+        """
+        self.direcionado = direcionado
+        self.ponderado = ponderado
+        self.espelhar = espelhar or direcionado
+        self.vertices = self._validar_vertices(vertices)
+        # índices de pertinência O(1), mantidos junto com as listas/dicts públicos
+        self._conjunto_vertices = set(self.vertices)
+        self._conjunto_arestas = set()
+        self._observadores = []
+        self._invalidar_caches(reindexar=False)
+        self._validar_entrada_arestas(arestas)
+
+    # -------------------- validações internas --------------------
+    def _validar_vertices(self, vertices):
+        for v in vertices:
+            if not isinstance(v, (str, int)):
+                raise ValueError("Os labels dos vértices devem ser inteiros ou strings")
+        return list(vertices)
+
+    def _validar_entrada_arestas(self, arestas):
+        """
+        Normaliza o armazenamento:
+          - se ponderado=False: self.arestas é uma LISTA de (u, v)
+          - se ponderado=True : self.arestas é um DICIONÁRIO {(u, v): peso}
+        """
+        if not self.ponderado:
+            # não ponderado: aceita apenas lista de (u, v)
+            if not isinstance(arestas, list):
+                raise ValueError("Para grafo não ponderado, arestas deve ser uma lista de (u, v)")
+            self.arestas = self._validar_arestas_lista_nao_ponderada(arestas)
+        else:
+            # ponderado: aceita dict {(u, v): peso} ou lista [(u, v, w)]
+            if isinstance(arestas, dict):
+                self.arestas = self._validar_arestas_dicionario_ponderado(arestas)
+            elif isinstance(arestas, list):
+                self.arestas = self._validar_arestas_lista_ponderada(arestas)
+            else:
+                raise ValueError("Para grafo ponderado, forneça dict {(u,v): peso} ou lista [(u,v,peso)]")
+
+    def _validar_arestas_lista_nao_ponderada(self, arestas):
+        valid_arestas = []
+        vertices = self._conjunto_vertices
+        for aresta in arestas:
+            if not isinstance(aresta, tuple) or len(aresta) != 2:
+                raise ValueError("Arestas devem ser tuplas (u, v) para grafo não ponderado")
+            u, v = aresta
+            if u not in vertices or v not in vertices:
+                raise ValueError(f"Aresta {aresta} contém vértices não existentes")
+            if not self.espelhar:
+                if (u, v) not in self._conjunto_arestas and (v, u) not in self._conjunto_arestas:
+                    valid_arestas.append((u, v))
+                    self._conjunto_arestas.add((u, v))
+            elif not self.direcionado:
+                valid_arestas.extend([(u, v), (v, u)])
+            else:
+                valid_arestas.append((u, v))
+        self._conjunto_arestas = set(valid_arestas)
+        return valid_arestas
+
+    def _validar_arestas_lista_ponderada(self, arestas):
+        """
+        Converte lista [(u,v,w)] em dict {(u,v): w}, duplicando se não-direcionado.
+        """
+        valid_arestas = {}
+        vertices = self._conjunto_vertices
+        for aresta in arestas:
+            if (not isinstance(aresta, tuple)) or len(aresta) != 3:
+                raise ValueError("Em grafo ponderado, use tuplas (u, v, peso)")
+            u, v, w = aresta
+            if u not in vertices or v not in vertices:
+                raise ValueError(f"Aresta {aresta} contém vértices não existentes")
+            if not isinstance(w, (int, float)):
+                raise ValueError("Pesos das arestas devem ser numéricos")
+            self._guardar_peso(valid_arestas, u, v, w)
+        return valid_arestas
+
+    def _validar_arestas_dicionario_ponderado(self, arestas):
+        valid_arestas = {}
+        vertices = self._conjunto_vertices
+        for aresta, valor in arestas.items():
+            if not isinstance(aresta, tuple) or len(aresta) != 2:
+                raise ValueError("Chaves do dicionário devem ser tuplas (u, v)")
+            u, v = aresta
+            if u not in vertices or v not in vertices:
+                raise ValueError(f"Aresta {aresta} contém vértices não existentes")
+            if not isinstance(valor, (int, float)):
+                raise ValueError("Pesos das arestas devem ser numéricos")
+            self._guardar_peso(valid_arestas, u, v, valor)
+        return valid_arestas
+
+    def _guardar_peso(self, pesos, u, v, w):
+        if not self.espelhar:
+            pesos[(v, u) if (v, u) in pesos else (u, v)] = w
+            return
+        pesos[(u, v)] = w
+        if not self.direcionado:
+            pesos[(v, u)] = w
+
+    # -------------------- impressão --------------------
+    def printar_grafo(self):
+        print(f"G = (V = [{', '.join(map(str, self.vertices))}], A = [", end="")
+        if not self.ponderado:
+            for i, a in enumerate(self.arestas):
+                print(f"{a}", end="")
+                if i != len(self.arestas) - 1:
+                    print(", ", end="")
+        else:
+            itens = list(self.arestas.items())
+            for i, (a, peso) in enumerate(itens):
+                print(f"{a}: {peso}", end="")
+                if i != len(itens) - 1:
+                    print(", ", end="")
+        print("])")
+
+    # -------------------- utilitários internos --------------------
+    def _iter_arcos(self):
+        """
+        Itera sobre arestas como (u, v) (independente de ponderação).
+        """
+        for (u, v, _) in self._iter_arcos_pesos():
+            yield (u, v)
+
+    def _iter_arcos_pesos(self):
+        """
+        Itera sobre arestas como (u, v, w).
+        Para não ponderado, retorna w = 1 por convenção.
+        Com espelhar=False, cada aresta guardada gera os dois sentidos.
+        """
+        itens = ((u, v, 1) for (u, v) in self.arestas) if not self.ponderado else \
+            ((u, v, w) for (u, v), w in self.arestas.items())
+        if self.espelhar:
+            yield from itens
+            return
+        for (u, v, w) in itens:
+            yield (u, v, w)
+            if u != v:
+                yield (v, u, w)
+
+    # -------------------- caches --------------------
+    def _invalidar_caches(self, reindexar=True):
+        """
+        Descarta adjacências, graus e CSR calculados. Só é necessário se
+        vertices/arestas forem alterados sem adicionar_vertice/adicionar_aresta;
+        nesse caso reconstrói também os índices de pertinência (conjuntos de
+        vértices e arestas). reindexar=False é para uso interno, quando os
+        índices já estão em dia. Os observadores recebem o evento "invalidacao".
+        """
+        if reindexar:
+            self._conjunto_vertices = set(self.vertices)
+            if not self.ponderado:
+                self._conjunto_arestas = set(self.arestas)
+        self._cache_adj = {}  # (ponderada, ordenada) -> {v: [...]}
+        self._cache_grau_entrada = None
+        self._cache_grau_saida = None
+        self._cache_csr = None
+        self._notificar("invalidacao")
+
+    def _registrar_arco(self, u, v, w, anterior=None):
+        """
+        Atualiza os caches existentes após inserir o arco (u, v) com peso w.
+        anterior é o peso antigo quando o arco já existia (troca de peso).
+        Avisa os observadores com o evento "arco".
+        """
+        self._cache_csr = None
+        for (ponderada, ordenada), lista in self._cache_adj.items():
+            adj = lista[u]
+            if anterior is not None:
+                if ponderada:
+                    adj[adj.index((v, anterior))] = (v, w)
+                    if ordenada:
+                        adj.sort()
+                continue
+            item = (v, w) if ponderada else v
+            if ordenada:
+                insort(adj, item)
+            else:
+                adj.append(item)
+        if anterior is None:
+            if self._cache_grau_saida is not None:
+                self._cache_grau_saida[u] += 1
+            if self._cache_grau_entrada is not None:
+                self._cache_grau_entrada[v] += 1
+        self._notificar("arco", u, v, w, anterior)
+
+    # -------------------- observadores --------------------
+    def registrar_observador(self, observador, fraco=False):
+        """
+        observador(evento, u, v, peso, anterior) é chamado a cada modificação:
+          - "vertice":     adicionar_vertice(u)
+          - "arco":        arco u -> v inserido com peso (1 se não ponderado) ou,
+                           se anterior não é None, peso trocado de anterior
+                           (aresta não direcionada gera um evento por sentido)
+          - "invalidacao": mudança em bloco (adicionar_arestas ou
+                           _invalidar_caches); os demais argumentos são None
+        Usado por estruturas derivadas (oraculo, apsp_dinamico) para se manterem
+        coerentes com o grafo.
+        fraco: guarda só uma referência fraca (weakref.WeakMethod para métodos),
+               então o grafo não mantém o dono do observador vivo; quando ele
+               é coletado, o observador sai da lista sozinho.
+        """
+        if observador in self._observadores_ativos():
+            return
+        if fraco:
+            referencia = weakref.WeakMethod if hasattr(observador, "__func__") else weakref.ref
+            observador = referencia(observador)
+        self._observadores.append(observador)
+
+    def remover_observador(self, observador):
+        self._observadores = [o for o in self._observadores
+                              if self._resolver_observador(o) not in (observador, None)]
+
+    @staticmethod
+    def _resolver_observador(entrada):
+        # referências fracas viram o observador (ou None, se já foi coletado)
+        return entrada() if isinstance(entrada, weakref.ref) else entrada
+
+    def _observadores_ativos(self):
+        ativos = [self._resolver_observador(o) for o in self._observadores]
+        if any(a is None for a in ativos):
+            self._observadores = [o for o, a in zip(self._observadores, ativos) if a is not None]
+            ativos = [a for a in ativos if a is not None]
+        return ativos
+
+    def _notificar(self, evento, u=None, v=None, peso=None, anterior=None):
+        if not self._observadores:
+            return
+        for observador in self._observadores_ativos():
+            observador(evento, u, v, peso, anterior)
+
+    # -------------------- graus --------------------
+    def grau_entrada_dos_vertices(self):
+        """
+        O dicionário retornado é o cache interno: não o modifique.
+        """
+        if self._cache_grau_entrada is None:
+            graus = {v: 0 for v in self.vertices}
+            for (u, v) in self._iter_arcos():
+                if v in graus:
+                    graus[v] += 1
+            self._cache_grau_entrada = graus
+        return self._cache_grau_entrada
+
+    def grau_saida_dos_vertices(self):
+        """
+        O dicionário retornado é o cache interno: não o modifique.
+        """
+        if self._cache_grau_saida is None:
+            graus = {v: 0 for v in self.vertices}
+            for (u, v) in self._iter_arcos():
+                if u in graus:
+                    graus[u] += 1
+            self._cache_grau_saida = graus
+        return self._cache_grau_saida
+
+    def graus_de_um_vertice(self, v):
+        entrada = self.grau_entrada_dos_vertices().get(v, 0)
+        saida   = self.grau_saida_dos_vertices().get(v, 0)
+        return entrada, saida
+
+    # -------------------- consultas --------------------
+    def verificar_aresta(self, aresta):
+        """
+        Aceita:
+          - (u, v)   -> checa existência da aresta
+          - (u, v, w) se ponderado=True -> checa existência com aquele peso exato
+        """
+        if not isinstance(aresta, tuple):
+            return False
+
+        if not self.ponderado:
+            if len(aresta) != 2:
+                return False
+            return (aresta in self._conjunto_arestas) or \
+                (not self.espelhar and (aresta[1], aresta[0]) in self._conjunto_arestas)
+        else:
+            if len(aresta) not in (2, 3):
+                return False
+            chave = self._chave_peso(aresta[0], aresta[1])
+            if len(aresta) == 2:
+                return chave in self.arestas
+            return self.arestas.get(chave, None) == aresta[2]
+
+    def _chave_peso(self, u, v):
+        """
+        Chave de (u, v) no dict de pesos: com espelhar=False pode estar como (v, u).
+        """
+        if not self.espelhar and (u, v) not in self.arestas and (v, u) in self.arestas:
+            return (v, u)
+        return (u, v)
+
+    def verificar_vertice(self, v):
+        return v in self._conjunto_vertices
+
+    def vertice_isolado(self, v):
+        return self.graus_de_um_vertice(v) == (0, 0)
+
+    # -------------------- modificações --------------------
+    def adicionar_vertice(self, v):
+        if not isinstance(v, (str, int, float)):
+            raise ValueError("Vértice a adicionar deve ser string ou numérico")
+        if v in self._conjunto_vertices:
+            return
+        self.vertices.append(v)
+        self._conjunto_vertices.add(v)
+        self._cache_csr = None
+        for lista in self._cache_adj.values():
+            lista[v] = []
+        if self._cache_grau_entrada is not None:
+            self._cache_grau_entrada[v] = 0
+        if self._cache_grau_saida is not None:
+            self._cache_grau_saida[v] = 0
+        self._notificar("vertice", v)
+
+    def adicionar_aresta(self, u, v, peso=None):
+        if u not in self._conjunto_vertices or v not in self._conjunto_vertices:
+            raise ValueError("Vértices não existem")
+
+        if not self.ponderado:
+            if peso is not None:
+                raise ValueError("Este grafo não é ponderado; não informe peso")
+            if not self.espelhar:
+                if not self.verificar_aresta((u, v)):
+                    self.arestas.append((u, v))
+                    self._conjunto_arestas.add((u, v))
+                    self._registrar_arco(u, v, 1)
+                    if u != v:
+                        self._registrar_arco(v, u, 1)
+                return
+            # Evita duplicação na representação direcionada
+            arcos = [(u, v)] if self.direcionado else [(u, v), (v, u)]
+            for (a, b) in arcos:
+                if (a, b) not in self._conjunto_arestas:
+                    self.arestas.append((a, b))
+                    self._conjunto_arestas.add((a, b))
+                    self._registrar_arco(a, b, 1)
+        else:
+            if not isinstance(peso, (int, float)):
+                raise ValueError("Peso numérico é obrigatório para grafo ponderado")
+            if not self.espelhar:
+                chave = self._chave_peso(u, v)
+                anterior = self.arestas.get(chave)
+                self.arestas[chave] = peso
+                if anterior is None or anterior != peso:
+                    self._registrar_arco(u, v, peso, anterior)
+                    if u != v:
+                        self._registrar_arco(v, u, peso, anterior)
+                return
+            arcos = [(u, v)] if self.direcionado else [(u, v), (v, u)]
+            for (a, b) in arcos:
+                anterior = self.arestas.get((a, b))
+                self.arestas[(a, b)] = peso
+                if anterior is None or anterior != peso:
+                    self._registrar_arco(a, b, peso, anterior)
+
+    def adicionar_arestas(self, arestas, pesos=None):
+        """
+        Insere muitas arestas de uma vez. arestas pode ser:
+          - array NumPy (m, 2) de labels, ou (m, 3) com o peso na última coluna
+          - iterável de tuplas (u, v) / (u, v, peso), como no construtor
+        pesos: um peso por aresta, como alternativa à terceira coluna.
+        A validação é feita por coluna (com arrays de labels inteiros, por busca
+        binária), as repetidas são removidas por ordenação (fica o último peso,
+        como em adicionar_aresta) e os caches são descartados uma única vez no
+        fim, em vez de atualizados a cada arco.
+        """
+        import numpy as np
+
+        us, vs, ws = self._colunas_arestas(arestas, pesos)
+        if len(us) == 0:
+            return
+        src = self._indices_labels(us)
+        dst = self._indices_labels(vs)
+        invalidas = np.flatnonzero((src < 0) | (dst < 0))
+        if invalidas.size:
+            k = int(invalidas[0])
+            raise ValueError(f"Aresta {(us[k], vs[k])} contém vértices não existentes")
+
+        if not self.direcionado and self.espelhar:
+            src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+            if ws is not None:
+                ws = np.repeat(ws, 2)
+        if not self.espelhar:
+            chave_a, chave_b = np.minimum(src, dst), np.maximum(src, dst)
+        else:
+            chave_a, chave_b = src, dst
+        ordem = np.lexsort((chave_b, chave_a))  # estável: repetidas mantêm a ordem de entrada
+        chave_a, chave_b = chave_a[ordem], chave_b[ordem]
+        ultima = np.ones(ordem.size, dtype=bool)
+        ultima[:-1] = (chave_a[1:] != chave_a[:-1]) | (chave_b[1:] != chave_b[:-1])
+        ordem = ordem[ultima]
+
+        vertices = self.vertices
+        pares = list(zip([vertices[a] for a in src[ordem].tolist()],
+                         [vertices[b] for b in dst[ordem].tolist()]))
+        if not self.ponderado:
+            conjunto = self._conjunto_arestas
+            if not conjunto:
+                novos = pares
+            elif self.espelhar:
+                novos = [p for p in pares if p not in conjunto]
+            else:
+                novos = [p for p in pares if p not in conjunto and (p[1], p[0]) not in conjunto]
+            self.arestas.extend(novos)
+            self._conjunto_arestas.update(novos)
+        elif self.espelhar:
+            self.arestas.update(zip(pares, ws[ordem].tolist()))
+        else:
+            for (u, v), w in zip(pares, ws[ordem].tolist()):
+                self.arestas[self._chave_peso(u, v)] = w
+        self._invalidar_caches(reindexar=False)
+
+    def _colunas_arestas(self, arestas, pesos):
+        """
+        Separa a entrada de adicionar_arestas em (us, vs, ws); us/vs ficam como
+        arrays (entrada NumPy) ou listas, ws é array numérico ou None.
+        """
+        import numpy as np
+
+        if isinstance(arestas, np.ndarray):
+            if arestas.ndim != 2 or arestas.shape[1] not in (2, 3):
+                raise ValueError("Array de arestas deve ter forma (m, 2) ou (m, 3)")
+            extremos = arestas[:, :2]
+            if arestas.shape[1] == 3:
+                if pesos is not None:
+                    raise ValueError("Informe o peso na terceira coluna ou em pesos, não nos dois")
+                pesos = arestas[:, 2]
+                # labels inteiros junto com pesos float viram float no array
+                if extremos.dtype.kind == "f" and np.all(extremos == np.floor(extremos)):
+                    extremos = extremos.astype(np.int64)
+            colunas = [extremos[:, 0], extremos[:, 1]]
+        else:
+            tam = 3 if self.ponderado and pesos is None else 2
+            itens = list(arestas)
+            for aresta in itens:
+                if not isinstance(aresta, tuple) or len(aresta) != tam:
+                    if tam == 3:
+                        raise ValueError("Em grafo ponderado, use tuplas (u, v, peso)")
+                    raise ValueError("Arestas devem ser tuplas (u, v)")
+            colunas = [list(c) for c in zip(*itens)] or [[] for _ in range(tam)]
+            if tam == 3:
+                pesos = colunas[2]
+
+        if not self.ponderado:
+            if pesos is not None:
+                raise ValueError("Este grafo não é ponderado; não informe peso")
+            return colunas[0], colunas[1], None
+        if pesos is None:
+            raise ValueError("Peso numérico é obrigatório para grafo ponderado")
+        ws = np.asarray(pesos)
+        if ws.dtype == object:  # coluna de array misto (labels str + pesos)
+            ws = np.asarray(ws.tolist())
+        elif ws.dtype.kind in "US":  # array de strings (labels str): pesos como texto
+            for tipo in (np.int64, np.float64):
+                try:
+                    ws = ws.astype(tipo)
+                    break
+                except ValueError:
+                    continue
+            else:
+                raise ValueError("Pesos das arestas devem ser numéricos")
+        if ws.dtype.kind not in "iuf" and ws.size:
+            raise ValueError("Pesos das arestas devem ser numéricos")
+        if ws.shape != (len(colunas[0]),):
+            raise ValueError("Informe um peso por aresta")
+        return colunas[0], colunas[1], ws
+
+    def _indices_labels(self, labels):
+        """
+        Posição de cada label em self.vertices (-1 se não existe), como array.
+        """
+        import numpy as np
+
+        if not self.vertices:
+            return np.full(len(labels), -1, dtype=np.int64)
+        if isinstance(labels, np.ndarray) and labels.dtype.kind in "iu" and \
+                all(isinstance(v, int) for v in self.vertices):
+            rotulos = np.asarray(self.vertices, dtype=np.int64)
+            ordem = np.argsort(rotulos, kind="stable")
+            ordenados = rotulos[ordem]
+            pos = np.minimum(np.searchsorted(ordenados, labels), len(rotulos) - 1)
+            return np.where(ordenados[pos] == labels, ordem[pos], -1)
+        if isinstance(labels, np.ndarray):
+            labels = labels.tolist()
+        idx = {v: i for i, v in enumerate(self.vertices)}
+        return np.fromiter((idx.get(v, -1) for v in labels), dtype=np.int64, count=len(labels))
+
+    # -------------------- representações --------------------
+    def lista_adjacencias(self, ponderada=False, ordenada=False):
+        """
+        Retorna dict {v: [vizinho,...]} (não ponderada) ou {v: [(vizinho,peso),...]} (ponderada=True).
+        ordenada=True devolve os vizinhos em ordem crescente.
+        O resultado fica em cache (atualizado por adicionar_vertice/adicionar_aresta),
+        então consultas repetidas são gratuitas; não modifique o dicionário retornado.
+        """
+        chave = (ponderada, ordenada)
+        if chave in self._cache_adj:
+            return self._cache_adj[chave]
+
+        if ordenada:
+            base = self.lista_adjacencias(ponderada=ponderada)
+            lista = {v: sorted(adj) for v, adj in base.items()}
+        else:
+            lista = {v: [] for v in self.vertices}
+            if not ponderada:
+                for (u, v) in self._iter_arcos():
+                    lista[u].append(v)
+            else:
+                for (u, v, w) in self._iter_arcos_pesos():
+                    lista[u].append((v, w))
+        self._cache_adj[chave] = lista
+        return lista
+
+    def matriz_de_adjacencias(self, ponderada=False, default=0):
+        """
+        Não ponderada: matriz 0/1
+        Ponderada: matriz de pesos (default fora da aresta)
+        """
+        tam = len(self.vertices)
+        idx = {v: i for i, v in enumerate(self.vertices)}
+        if not ponderada:
+            matriz = [[0] * tam for _ in range(tam)]
+            for (u, v) in self._iter_arcos():
+                matriz[idx[u]][idx[v]] = 1
+            return matriz
+        else:
+            matriz = [[default] * tam for _ in range(tam)]
+            for (u, v, w) in self._iter_arcos_pesos():
+                matriz[idx[u]][idx[v]] = w
+            return matriz
+
+    def matriz_numpy(self, ponderada=False, default=0, dtype=None):
+        """
+        Como matriz_de_adjacencias, mas num único array NumPy V x V
+        (ver GrafoCSR.matriz_numpy).
+        """
+        return self.csr().matriz_numpy(ponderada, default, dtype)
+
+    def matriz_esparsa(self, formato="csr", ponderada=False, dtype=None, usar_scipy=None):
+        """
+        Matriz de adjacência esparsa (scipy.sparse se disponível, senão arrays
+        NumPy), na ordem de self.vertices. Ver GrafoCSR.matriz_esparsa.
+        """
+        return self.csr().matriz_esparsa(formato, ponderada, dtype, usar_scipy)
+
+    def csr(self):
+        """
+        Retorna uma cópia compacta do grafo (GrafoCSR), com vértices indexados
+        por inteiros e adjacências em arrays NumPy. Fica em cache até a próxima
+        modificação do grafo.
+        """
+        if self._cache_csr is None:
+            from .grafo_csr import GrafoCSR
+            self._cache_csr = GrafoCSR.de_grafo(self)
+        return self._cache_csr
+
+    # -------------------- conectividade --------------------
+    def conexo_por_mm(self, m=None, ignorar_indices=None):
+        """
+        Mantido pelo nome antigo: a resposta é a mesma do somatório de potências
+        da matriz de adjacência, mas calculada em O(V + E) por componentes
+        fortemente conexas (ver conectividade.conexo). Pesos são ignorados.
+        """
+        from .conectividade import conexo
+        return conexo(self, m=m, ignorar_indices=ignorar_indices)
+
+
+# -------------------- Testes rápidos --------------------
+if __name__ == "__main__":
+    # Teste 1 – Grafo direcionado NÃO ponderado
+    # print("Teste 1: Grafo direcionado simples (não ponderado)")
+    # grafo1 = Grafo(vertices=[1, 2, 3], arestas=[(1, 2), (2, 3)], direcionado=True, ponderado=False)
+    # grafo1.printar_grafo()
+    # print("Grau de entrada:", grafo1.grau_entrada_dos_vertices())
+    # print("Grau de saída:", grafo1.grau_saida_dos_vertices())
+    # print("Graus do vértice 2:", grafo1.graus_de_um_vertice(2))
+    # print("Lista de adjacência:", grafo1.lista_adjacencias())
+    # print("Matriz de adjacência:")
+    # for linha in grafo1.matriz_de_adjacencias():
+    #     print(linha)
+    # print("Vértice 3 é isolado?", grafo1.vertice_isolado(3))
+    # print()
+    # print("Aqui!!! ",grafo1.arestas)
+
+    # # Teste 2 – Adição de vértice e aresta (não ponderado)
+    # print("Teste 2: Adicionando vértice e aresta")
+    # grafo1.adicionar_vertice(4)
+    # grafo1.adicionar_aresta(3, 4)
+    # grafo1.printar_grafo()
+    # print("Lista de adjacência atualizada:", grafo1.lista_adjacencias())
+    # print()
+
+    # Teste 3 – Grafo PONDERADO (direcionado)
+    print("Teste 3: Grafo ponderado (dict)")
+    grafo2 = Grafo(vertices=['A', 'B', 'C'],
+                   arestas={('A', 'B'): 5, ('B', 'C'): -2},
+                   direcionado=True, ponderado=True)
+    
+    print("aquiii !!! ", grafo2.arestas)
+    grafo2.printar_grafo()
+    print("Verificar aresta ('A', 'B'):", grafo2.verificar_aresta(('A', 'B')))
+    print("Verificar aresta ('A', 'B', 5):", grafo2.verificar_aresta(('A', 'B', 5)))
+    print("Lista de adjacência (ponderada):", grafo2.lista_adjacencias(ponderada=True))
+    print("Matriz de adjacência (ponderada):")
+    for linha in grafo2.matriz_de_adjacencias(ponderada=True, default=0):
+        print(linha)
+    print()
+
+    # # Teste 4 – Grafo PONDERADO a partir de lista [(u,v,w)]
+    # print("Teste 4: Grafo ponderado (lista)")
+    # grafo3 = Grafo(vertices=[1, 2, 3],
+    #                arestas=[(1, 2, 1.5), (2, 3, 0.7)],
+    #                direcionado=False, ponderado=True)
+    # grafo3.printar_grafo()
+    # grafo3.adicionar_aresta(1, 3, peso=2.0)
+    # print("Adjacências ponderadas:", grafo3.lista_adjacencias(ponderada=True))
+    # print("Matriz ponderada:")
+    # for linha in grafo3.matriz_de_adjacencias(ponderada=True, default=0):
+    #     print(linha)
+
+    
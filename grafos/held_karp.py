@@ -0,0 +1,165 @@
+# Soluções exatas para o caixeiro viajante em instâncias pequenas
+# 1. Held-Karp: programação dinâmica sobre (subconjunto, último vértice),
+#    camada por camada de |subconjunto|, com transições vetorizadas em NumPy
+# 2. Branch-and-bound: busca em profundidade podada por um limite inferior,
+#    começando com o custo da heurística de caixeiro.py como limite superior
+
+import numpy as np
+
+from .grafo_utils import Grafo
+from .caixeiro import matriz_distancias, rota_heuristica
+from .instrumentacao import contar
+
+MEMORIA_MAXIMA = 4 * 2 ** 30  # bytes das tabelas de held_karp (4 GiB)
+
+
+def _contar_bits(x):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x)
+    total = np.zeros(x.shape, dtype=np.uint8)
+    while np.any(x):
+        total += (x & 1).astype(np.uint8)
+        x = x >> 1
+    return total
+
+
+def held_karp(G: Grafo, dtype=np.float64, bloco=1 << 16, memoria_maxima=MEMORIA_MAXIMA):
+    """
+    Ciclo hamiltoniano de custo mínimo por Held-Karp, O(2^n n^2) tempo e
+    O(2^n n) memória. A tabela custo[S, j] (melhor caminho que sai do primeiro
+    vértice, visita S e termina em j) usa dtype: np.float32 reduz a memória
+    pela metade; dtypes inteiros (pesos inteiros) também são aceitos.
+    bloco limita quantos subconjuntos são combinados de uma vez.
+    memoria_maxima (bytes): ValueError se as tabelas não cabem nesse limite.
+    Retorna (H, custo) como rota_heuristica, ou (None, inf) se não há ciclo.
+    """
+    vertices = G.csr().vertices
+    n = len(vertices)
+    if n == 0:
+        return None, float("inf")
+    if n == 1:
+        return [vertices[0], vertices[0]], 0
+    if n - 1 > 127:
+        raise ValueError("Held-Karp só é viável para instâncias pequenas")
+    dtype = np.dtype(dtype)
+    # custo (dtype) e pai (int8) por estado, mais a contagem de bits (uint64)
+    # de cada subconjunto
+    memoria = (1 << (n - 1)) * ((n - 1) * (dtype.itemsize + 1) + 8)
+    if memoria > memoria_maxima:
+        raise ValueError(f"Held-Karp com {n} vértices precisaria de {memoria / 2 ** 30:.1f} GiB "
+                         f"(limite de {memoria_maxima / 2 ** 30:.1f} GiB); use branch_and_bound "
+                         f"ou bellmore_nemhauser")
+
+    D = matriz_distancias(G)
+    if dtype.kind in "iu":
+        infinito = np.iinfo(dtype).max // 4
+        D = np.where(np.isinf(D), infinito, D)
+    else:
+        infinito = np.inf
+    D = D.astype(dtype)
+
+    m = n - 1  # o vértice 0 é a partida; os demais viram bits 0..m-1
+    resto = D[1:, 1:]
+    custo = np.full((1 << m, m), infinito, dtype=dtype)
+    pai = np.full((1 << m, m), -1, dtype=np.int8)
+    for j in range(m):
+        custo[1 << j, j] = D[0, j + 1]
+
+    bits = _contar_bits(np.arange(1 << m, dtype=np.uint64))
+    for tamanho in range(2, m + 1):
+        camada = np.flatnonzero(bits == tamanho)
+        for j in range(m):
+            bit = 1 << j
+            com_j = camada[(camada & bit) != 0]
+            for ini in range(0, com_j.size, bloco):
+                S = com_j[ini:ini + bloco]
+                candidatos = custo[S ^ bit] + resto[:, j]
+                escolha = np.argmin(candidatos, axis=1)
+                melhor = candidatos[np.arange(S.size), escolha]
+                if dtype.kind in "iu":
+                    melhor = np.minimum(melhor, infinito)
+                custo[S, j] = melhor
+                pai[S, j] = escolha
+
+    contar("held_karp.estados", (1 << m) * m)
+    cheio = (1 << m) - 1
+    fechamento = custo[cheio] + D[1:, 0]
+    ultimo = int(np.argmin(fechamento))
+    total = fechamento[ultimo]
+    if total >= infinito:
+        return None, float("inf")
+
+    caminho = []
+    S, j = cheio, ultimo
+    while j >= 0:
+        caminho.append(j + 1)
+        S, j = S ^ (1 << j), int(pai[S, j])
+    H = [vertices[0]] + [vertices[k] for k in reversed(caminho)] + [vertices[0]]
+    return H, total.item()
+
+
+def branch_and_bound(G: Grafo, limite_superior=None, tour_inicial=None):
+    """
+    Busca exata em profundidade a partir do primeiro vértice, visitando vizinhos
+    em ordem de custo e podando quando custo + limite inferior (menor saída de
+    cada vértice ainda a deixar) não melhora o limite superior.
+    Sem limite dado, usa rota_heuristica (vizinho mais próximo + 2-opt/Or-opt).
+    Retorna (H, custo).
+    """
+    vertices = G.csr().vertices
+    n = len(vertices)
+    if n <= 1:
+        return held_karp(G)
+    if limite_superior is None:
+        tour_inicial, limite_superior = rota_heuristica(G)
+    melhor = [limite_superior, tour_inicial]
+
+    D = matriz_distancias(G)
+    sem_diagonal = D + np.diag(np.full(n, np.inf))
+    menor_saida = sem_diagonal.min(axis=1).tolist()
+    ordem = np.argsort(sem_diagonal, axis=1, kind="stable").tolist()
+    dist = D.tolist()
+
+    livre = [True] * n
+    livre[0] = False
+    caminho = [0]
+
+    nos = [0]
+
+    def buscar(atual, custo, falta_limite):
+        nos[0] += 1
+        if len(caminho) == n:
+            total = custo + dist[atual][0]
+            if total < melhor[0]:
+                melhor[0] = total
+                melhor[1] = [vertices[i] for i in caminho] + [vertices[0]]
+            return
+        for prox in ordem[atual]:
+            if not livre[prox]:
+                continue
+            novo = custo + dist[atual][prox]
+            restante = falta_limite - menor_saida[prox]
+            if novo + menor_saida[prox] + restante >= melhor[0]:
+                if dist[atual][prox] == float("inf"):
+                    break
+                continue
+            livre[prox] = False
+            caminho.append(prox)
+            buscar(prox, novo, restante)
+            caminho.pop()
+            livre[prox] = True
+
+    buscar(0, 0, sum(menor_saida) - menor_saida[0])
+    contar("branch_and_bound.nos", nos[0])
+    if melhor[1] is None:
+        return None, float("inf")
+    return melhor[1], melhor[0]
+
+
+def rota_otima(G: Grafo, limite_held_karp=20, dtype=np.float64):
+    """
+    Escolhe Held-Karp até limite_held_karp vértices e branch-and-bound acima disso.
+    """
+    if len(G.csr().vertices) <= limite_held_karp:
+        return held_karp(G, dtype=dtype)
+    return branch_and_bound(G)
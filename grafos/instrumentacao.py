@@ -0,0 +1,118 @@
+# Instrumentação dos algoritmos: contadores, cronômetros por fase, séries de
+# valores e pico de memória (tracemalloc), desligados por padrão.
+# Os algoritmos acumulam contagens em variáveis locais e só as entregam aqui
+# no fim (com ativo() falso, contar/registrar_serie retornam na hora e fase()
+# devolve um contexto vazio), então o custo desligado é desprezível.
+#     from grafos.instrumentacao import coletar
+#     with coletar(memoria=True) as est:
+#         bellman_ford(G, origem)
+#     est.contadores["bellman_ford.passadas"], est.como_dict()
+
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_ATUAL = None  # Estatisticas sendo coletadas, ou None
+
+
+class Estatisticas:
+    def __init__(self):
+        """
+        contadores -> {nome: total}, ex. "bfs.arestas_examinadas"
+        tempos     -> {fase: segundos somados}, ex. "floyd_warshall.iteracoes"
+        series     -> {nome: [valores]}, ex. melhorias por k do Floyd-Warshall
+        pico_memoria -> bytes (só com coletar(memoria=True))
+        """
+        self.contadores = {}
+        self.tempos = {}
+        self.series = {}
+        self.pico_memoria = None
+
+    def como_dict(self):
+        dados = {"contadores": dict(self.contadores), "tempos": dict(self.tempos),
+                 "series": {k: list(v) for k, v in self.series.items()}}
+        if self.pico_memoria is not None:
+            dados["pico_memoria"] = self.pico_memoria
+        return dados
+
+    def __repr__(self):
+        return f"Estatisticas({self.como_dict()!r})"
+
+
+def ativo():
+    return _ATUAL is not None
+
+
+def contar(nome, valor=1):
+    if _ATUAL is None:
+        return
+    _ATUAL.contadores[nome] = _ATUAL.contadores.get(nome, 0) + valor
+
+
+def registrar_serie(nome, valores):
+    if _ATUAL is None:
+        return
+    _ATUAL.series.setdefault(nome, []).extend(valores)
+
+
+class _SemFase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        return False
+
+
+_SEM_FASE = _SemFase()
+
+
+class _Cronometro:
+    def __init__(self, estatisticas, nome):
+        self.estatisticas = estatisticas
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        tempos = self.estatisticas.tempos
+        tempos[self.nome] = tempos.get(self.nome, 0.0) + time.perf_counter() - self.inicio
+        return False
+
+
+def fase(nome):
+    """
+    Contexto que soma a duração do bloco em tempos[nome] (nada, se desligado).
+    """
+    if _ATUAL is None:
+        return _SEM_FASE
+    return _Cronometro(_ATUAL, nome)
+
+
+@contextmanager
+def coletar(memoria=False):
+    """
+    Liga a instrumentação dentro do bloco e entrega o objeto Estatisticas.
+    memoria=True mede o pico com tracemalloc (que deixa o código mais lento).
+    Blocos aninhados coletam separadamente; o externo volta ao sair do interno.
+    """
+    global _ATUAL
+    anterior = _ATUAL
+    estatisticas = Estatisticas()
+    rastreando = False
+    if memoria:
+        rastreando = tracemalloc.is_tracing()
+        if rastreando:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+    _ATUAL = estatisticas
+    try:
+        yield estatisticas
+    finally:
+        _ATUAL = anterior
+        if memoria:
+            estatisticas.pico_memoria = tracemalloc.get_traced_memory()[1]
+            if not rastreando:
+                tracemalloc.stop()
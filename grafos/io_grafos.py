@@ -0,0 +1,221 @@
+# Leitura e escrita de grafos em arquivo
+# 1. Lista de arestas CSV/TSV (uma aresta "u,v" ou "u,v,peso" por linha), lida
+#    em blocos de linhas e convertida direto em arrays para montar o GrafoCSR,
+#    sem passar pela validação elemento a elemento do Grafo
+# 2. Snapshot binário: diretório com indptr/indices/pesos/labels em .npy e um
+#    metadados.json, aberto com np.load(mmap_mode='r') sem copiar os arrays
+#    (processos que abrem o mesmo snapshot compartilham as páginas do arquivo)
+
+import json
+import os
+import warnings
+from itertools import islice
+
+import numpy as np
+
+from .grafo_csr import GrafoCSR
+
+_VERSAO_SNAPSHOT = 1
+
+
+# -------------------- lista de arestas --------------------
+def _separador_padrao(caminho, separador):
+    if separador is not None:
+        return separador
+    return "\t" if str(caminho).endswith(".tsv") else ","
+
+
+def _ler_colunas(linhas, separador, comentario, usecols, dtype):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # bloco só com comentários
+        return np.loadtxt(linhas, delimiter=separador, comments=comentario or None,
+                          usecols=usecols, dtype=dtype, ndmin=2)
+
+
+def _converter_pesos(linhas, separador, comentario):
+    # pesos inteiros continuam inteiros, como no Grafo
+    try:
+        return _ler_colunas(linhas, separador, comentario, (2,), np.int64)[:, 0]
+    except ValueError:
+        pass
+    try:
+        return _ler_colunas(linhas, separador, comentario, (2,), np.float64)[:, 0]
+    except ValueError:
+        raise ValueError("Em grafo ponderado, cada linha deve ter um peso numérico")
+
+
+def _internar(extremos, indice):
+    """
+    Índices globais para os labels (strings) de um bloco, atribuídos na ordem
+    em que aparecem pela primeira vez.
+    """
+    unicos, primeira, inverso = np.unique(extremos, return_index=True, return_inverse=True)
+    mapa = np.empty(unicos.size, dtype=np.int64)
+    for k in np.argsort(primeira, kind="stable").tolist():
+        mapa[k] = indice.setdefault(str(unicos[k]), len(indice))
+    return mapa[inverso]
+
+
+def ler_lista_arestas(caminho, direcionado=True, ponderado=False, separador=None,
+                      cabecalho=False, labels_inteiros=False, comentario="#",
+                      tamanho_bloco=1 << 20):
+    """
+    Lê uma lista de arestas e retorna um GrafoCSR.
+    separador: padrão "\\t" para .tsv e "," para os demais.
+    cabecalho: descarta a primeira linha.
+    labels_inteiros: labels convertidos para int e ordenados (np.unique);
+                     senão ficam como strings, na ordem em que aparecem.
+    Linhas vazias ou iniciadas por comentario são ignoradas, assim como colunas
+    além de u, v (e peso, se ponderado). O arquivo é lido
+    em blocos de tamanho_bloco linhas, cada um convertido por np.loadtxt;
+    arestas repetidas ficam com o último peso.
+    """
+    separador = _separador_padrao(caminho, separador)
+    indice = {}
+    blocos_src, blocos_dst, blocos_pesos = [], [], []
+
+    with open(caminho, encoding="utf-8") as arquivo:
+        if cabecalho:
+            next(arquivo, None)
+        while True:
+            linhas = list(islice(arquivo, tamanho_bloco))
+            if not linhas:
+                break
+            try:
+                tipo = np.int64 if labels_inteiros else str
+                extremos = _ler_colunas(linhas, separador, comentario, (0, 1), tipo)
+            except ValueError:
+                if labels_inteiros:
+                    raise ValueError("Com labels_inteiros=True, os labels devem ser inteiros")
+                raise ValueError("Cada linha deve ter ao menos as colunas u e v")
+            if extremos.size == 0:
+                continue
+            if labels_inteiros:
+                blocos_src.append(extremos[:, 0])
+                blocos_dst.append(extremos[:, 1])
+            else:
+                ids = _internar(extremos[:, :2].ravel(), indice)
+                blocos_src.append(ids[0::2])
+                blocos_dst.append(ids[1::2])
+            if ponderado:
+                blocos_pesos.append(_converter_pesos(linhas, separador, comentario))
+
+    vazio = np.empty(0, dtype=np.int64)
+    src = np.concatenate(blocos_src) if blocos_src else vazio
+    dst = np.concatenate(blocos_dst) if blocos_dst else vazio
+    pesos = None
+    if ponderado:
+        pesos = np.concatenate(blocos_pesos) if blocos_pesos else np.empty(0)
+
+    if labels_inteiros:
+        labels, inverso = np.unique(np.concatenate([src, dst]), return_inverse=True)
+        src, dst = inverso[:src.size], inverso[src.size:]
+        vertices = labels.tolist()
+    else:
+        vertices = list(indice)
+
+    csr = GrafoCSR.__new__(GrafoCSR)
+    csr.direcionado = direcionado
+    csr.ponderado = ponderado
+    csr._definir_vertices(vertices)
+    if not direcionado:
+        src, dst, pesos = csr._espelhar(src, dst, pesos)
+    csr._montar(src, dst, pesos)
+    return csr
+
+
+def salvar_lista_arestas(G, caminho, separador=None, tamanho_bloco=1 << 20):
+    """
+    Escreve G (Grafo ou GrafoCSR) como lista de arestas, uma por linha.
+    Em grafo não direcionado cada aresta é escrita uma única vez.
+    Vértices isolados não aparecem no arquivo.
+    """
+    separador = _separador_padrao(caminho, separador)
+    csr = G.csr()
+    labels = [str(v) for v in csr.vertices]
+    src, dst = csr.origens(), csr.indices
+    pesos = csr.pesos if csr.ponderado else None
+    if not csr.direcionado:
+        manter = src <= dst
+        src, dst = src[manter], dst[manter]
+        if pesos is not None:
+            pesos = pesos[manter]
+
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for ini in range(0, src.size, tamanho_bloco):
+            us = src[ini:ini + tamanho_bloco].tolist()
+            vs = dst[ini:ini + tamanho_bloco].tolist()
+            if pesos is None:
+                linhas = (f"{labels[u]}{separador}{labels[v]}\n" for u, v in zip(us, vs))
+            else:
+                ws = pesos[ini:ini + tamanho_bloco].tolist()
+                linhas = (f"{labels[u]}{separador}{labels[v]}{separador}{w}\n"
+                          for u, v, w in zip(us, vs, ws))
+            arquivo.writelines(linhas)
+
+
+# -------------------- snapshot binário --------------------
+def salvar_snapshot(G, diretorio):
+    """
+    Grava o CSR de G em diretorio: indptr.npy, indices.npy, pesos.npy (se
+    ponderado), labels.npy (ou labels.json se há labels int e str misturados)
+    e metadados.json.
+    """
+    csr = G.csr()
+    os.makedirs(diretorio, exist_ok=True)
+    np.save(os.path.join(diretorio, "indptr.npy"), csr.indptr)
+    np.save(os.path.join(diretorio, "indices.npy"), csr.indices)
+    if csr.ponderado:
+        np.save(os.path.join(diretorio, "pesos.npy"), csr.pesos)
+
+    labels = csr.vertices
+    if all(isinstance(v, int) for v in labels):
+        tipo_labels = "int"
+        np.save(os.path.join(diretorio, "labels.npy"), np.asarray(labels, dtype=np.int64))
+    elif all(isinstance(v, str) for v in labels):
+        tipo_labels = "str"
+        np.save(os.path.join(diretorio, "labels.npy"), np.asarray(labels, dtype=str))
+    else:
+        tipo_labels = "json"
+        with open(os.path.join(diretorio, "labels.json"), "w", encoding="utf-8") as arquivo:
+            json.dump(labels, arquivo)
+
+    metadados = {
+        "versao": _VERSAO_SNAPSHOT,
+        "direcionado": csr.direcionado,
+        "ponderado": csr.ponderado,
+        "labels": tipo_labels,
+        "num_vertices": csr.num_vertices(),
+        "num_arcos": csr.num_arcos(),
+    }
+    with open(os.path.join(diretorio, "metadados.json"), "w", encoding="utf-8") as arquivo:
+        json.dump(metadados, arquivo, indent=2)
+
+
+def carregar_snapshot(diretorio, mmap=True):
+    """
+    Abre um snapshot gravado por salvar_snapshot. Com mmap=True os arrays CSR
+    são mapeados somente leitura (carga quase instantânea; só a tabela de
+    labels é lida para a memória).
+    """
+    with open(os.path.join(diretorio, "metadados.json"), encoding="utf-8") as arquivo:
+        metadados = json.load(arquivo)
+    if metadados.get("versao") != _VERSAO_SNAPSHOT:
+        raise ValueError("Versão de snapshot não suportada")
+
+    modo = "r" if mmap else None
+    indptr = np.load(os.path.join(diretorio, "indptr.npy"), mmap_mode=modo)
+    indices = np.load(os.path.join(diretorio, "indices.npy"), mmap_mode=modo)
+    pesos = None
+    if metadados["ponderado"]:
+        pesos = np.load(os.path.join(diretorio, "pesos.npy"), mmap_mode=modo)
+
+    if metadados["labels"] == "json":
+        with open(os.path.join(diretorio, "labels.json"), encoding="utf-8") as arquivo:
+            vertices = json.load(arquivo)
+    else:
+        vertices = np.load(os.path.join(diretorio, "labels.npy")).tolist()
+
+    return GrafoCSR.de_arrays(vertices, indptr, indices, pesos,
+                              direcionado=metadados["direcionado"],
+                              ponderado=metadados["ponderado"])
@@ -0,0 +1,78 @@
+import numpy as np
+
+from .grafo_utils import Grafo
+from .bellman_ford import bellman_ford
+from .dijkstra import _dijkstra_csr
+from .instrumentacao import fase
+
+
+def _potenciais(csr):
+    """
+    Potenciais h de Johnson: distâncias (via bellman_ford) a partir de um
+    vértice extra ligado a todos com peso 0. Sem arcos negativos, h = 0.
+    """
+    n = csr.num_vertices()
+    if not csr.ponderado or csr.pesos.size == 0 or csr.pesos.min() >= 0:
+        return [0] * n
+
+    extra = "__johnson__"
+    existentes = set(csr.vertices)
+    while extra in existentes:
+        extra += "_"
+    arestas = [(extra, v, 0) for v in csr.vertices]
+    arestas.extend(csr._iter_arcos_pesos())
+    auxiliar = Grafo(csr.vertices + [extra], arestas, direcionado=True, ponderado=True)
+    dist, _ = bellman_ford(auxiliar, extra)
+    return [dist[v] for v in csr.vertices]
+
+
+_ESTRUTURA_TRABALHO = None
+
+
+def _iniciar_trabalhador(estrutura):
+    global _ESTRUTURA_TRABALHO
+    _ESTRUTURA_TRABALHO = estrutura
+
+
+def _linha(origem):
+    indptr, indices, pesos, h = _ESTRUTURA_TRABALHO
+    dist, pred = _dijkstra_csr(indptr, indices, pesos, origem)
+    hs = h[origem]
+    return [d - hs + hv for d, hv in zip(dist, h)], pred
+
+
+def johnson(grafo: Grafo, processos=None):
+    """
+    Caminhos mínimos entre todos os pares para grafos esparsos (O(V E log V)),
+    aceitando arcos negativos: reponderação com bellman_ford e um Dijkstra por
+    origem (distribuídos num pool de processos se processos > 1).
+    Retorna (D, P) no mesmo formato de floyd_warshall_matricial.
+    """
+    csr = grafo.csr()
+    n = csr.num_vertices()
+    with fase("johnson.potenciais"):
+        h = _potenciais(csr)
+
+    indptr = csr.indptr.tolist()
+    indices = csr.indices.tolist()
+    pesos = csr.pesos.tolist() if csr.ponderado else [1] * len(indices)
+    origens = csr.origens().tolist()
+    # w'(u, v) = w + h(u) - h(v) >= 0 (max evita resíduos negativos de ponto flutuante)
+    reponderados = [max(0, w + h[u] - h[v]) for u, v, w in zip(origens, indices, pesos)]
+    estrutura = (indptr, indices, reponderados, h)
+
+    D = np.empty((n, n))
+    P = np.empty((n, n), dtype=csr.indices.dtype)
+    with fase("johnson.dijkstras"):
+        if processos and processos > 1:
+            from multiprocessing import Pool
+            with Pool(processos, initializer=_iniciar_trabalhador, initargs=(estrutura,)) as pool:
+                linhas = pool.imap(_linha, range(n), chunksize=max(1, n // (4 * processos)))
+                for i, (dist, pred) in enumerate(linhas):
+                    D[i], P[i] = dist, pred
+        else:
+            _iniciar_trabalhador(estrutura)
+            for i in range(n):
+                D[i], P[i] = _linha(i)
+    np.fill_diagonal(P, -1)
+    return D, P
@@ -0,0 +1,276 @@
+# Oráculo de distâncias para muitas consultas ponto a ponto num Grafo que
+# muda pouco. O pré-processamento escolhe k marcos (landmarks) pelo critério
+# do mais distante e guarda as distâncias de cada marco e até cada marco;
+# cada consulta é um A* com a heurística ALT, que vem da desigualdade
+# triangular (admissível e consistente com pesos não negativos):
+#     d(v, t) >= d(m, t) - d(m, v)      d(v, t) >= d(v, m) - d(t, m)
+# As respostas (s, t) e as árvores de uma origem ficam em caches LRU
+# limitados. O oráculo é observador do Grafo: adicionar_aresta,
+# adicionar_vertice e adicionar_arestas descartam caches e marcos, que são
+# recalculados na próxima consulta. A referência do grafo ao oráculo é fraca:
+# um oráculo descartado é coletado normalmente, sem precisar de fechar().
+#     oraculo = OraculoDistancias(G, num_marcos=8)
+#     oraculo.distancia("a", "b"), oraculo.caminho("a", "b"), oraculo.arvore("a")
+
+from collections import OrderedDict
+from heapq import heappop, heappush
+from operator import sub
+
+from .grafo_utils import Grafo
+from .dijkstra import _dijkstra_csr
+from .instrumentacao import contar
+
+_INF = float("inf")
+# inf nas tabelas dos marcos vira _GRANDE: assim d(m, t) - d(m, v) sai ~0
+# quando m não alcança nenhum dos dois, e >= _GRANDE / 2 só quando a
+# desigualdade prova que t é inalcançável a partir de v
+_GRANDE = 1e300
+
+
+def _a_estrela_csr(indptr, indices, pesos, origem, destino, limite):
+    """
+    A* sobre listas CSR com remoção preguiçosa; limite(v) é a estimativa
+    admissível de d(v, destino) (inf: destino inalcançável a partir de v,
+    então v nem entra no heap). Retorna (distância, pred) com pred só dos
+    vértices alcançados.
+    """
+    dist = {origem: 0}
+    pred = {origem: -1}
+    heap = [(limite(origem), 0, origem)]
+    retiradas = 0
+    while heap:
+        _, d, u = heappop(heap)
+        retiradas += 1
+        if d > dist[u]:
+            continue
+        if u == destino:
+            break
+        for pos in range(indptr[u], indptr[u + 1]):
+            v = indices[pos]
+            nd = d + pesos[pos]
+            if nd < dist.get(v, _INF):
+                h = limite(v)
+                if h == _INF:
+                    continue
+                dist[v] = nd
+                pred[v] = u
+                heappush(heap, (nd + h, nd, v))
+    contar("oraculo.retiradas_do_heap", retiradas)
+    return dist.get(destino, _INF), pred
+
+
+class OraculoDistancias:
+    def __init__(self, grafo: Grafo, num_marcos=8, capacidade=4096, capacidade_arvores=16):
+        """
+        grafo: Grafo com pesos não negativos (sem peso, cada arco vale 1)
+        num_marcos: quantidade de marcos do ALT (mais marcos, limites melhores
+                    e pré-processamento/memória O(k V) maiores)
+        capacidade: respostas (s, t) guardadas no cache LRU
+        capacidade_arvores: árvores de uma origem (dist, pai) guardadas
+        O pré-processamento é feito na primeira consulta.
+        """
+        if num_marcos < 1:
+            raise ValueError("O oráculo precisa de pelo menos um marco")
+        if capacidade < 0 or capacidade_arvores < 0:
+            raise ValueError("Capacidade dos caches não pode ser negativa")
+        self.grafo = grafo
+        self.num_marcos = num_marcos
+        self.capacidade = capacidade
+        self.capacidade_arvores = capacidade_arvores
+        self._respostas = OrderedDict()  # (s, t) -> (distância, caminho)
+        self._arvores = OrderedDict()    # s -> (dist, pai)
+        self._estrutura = None
+        grafo.registrar_observador(self._grafo_modificado, fraco=True)
+
+    def fechar(self):
+        """
+        Deixa de observar o grafo e libera os caches (o oráculo não deve mais
+        ser usado). Opcional: o grafo só guarda uma referência fraca.
+        """
+        self.grafo.remover_observador(self._grafo_modificado)
+        self.limpar()
+
+    def limpar(self):
+        self._respostas.clear()
+        self._arvores.clear()
+        self._estrutura = None
+
+    def _grafo_modificado(self, evento, u, v, peso, anterior):
+        # qualquer inserção ou troca de peso pode encurtar (ou alongar)
+        # distâncias e tornar os limites dos marcos inadmissíveis
+        contar("oraculo.invalidacoes")
+        self.limpar()
+
+    # -------------------- pré-processamento --------------------
+    def _preparar(self):
+        if self._estrutura is not None:
+            return self._estrutura
+        import numpy as np
+
+        csr = self.grafo.csr()
+        if csr.ponderado and csr.pesos.size and csr.pesos.min() < 0:
+            raise ValueError("O oráculo não aceita pesos negativos")
+        n = csr.num_vertices()
+        adjacencias = []
+        for g in (csr, csr.transposta()):
+            pesos = g.pesos.tolist() if g.ponderado else [1] * g.num_arcos()
+            adjacencias.append((g.indptr.tolist(), g.indices.tolist(), pesos))
+        ida, volta = adjacencias
+
+        # marcos pelo mais distante: cada um maximiza a distância (de ou até)
+        # ao conjunto já escolhido; vértices fora do alcance de todos os
+        # marcos (outra componente) têm prioridade, o de maior grau primeiro.
+        # Vértices isolados nunca viram marco (não dão limite algum), mas há
+        # sempre pelo menos um marco, o vértice de maior grau se preciso
+        marcos, de_marcos, ate_marcos = [], [], []
+        if n:
+            graus = np.diff(csr.indptr) + (np.diff(csr.transposta().indptr) if csr.direcionado else 0)
+            inicio = int(np.argmax(graus))
+            cobertura = np.asarray(_dijkstra_csr(*ida, inicio)[0], dtype=float)
+            while len(marcos) < min(self.num_marcos, n):
+                fora = np.isinf(cobertura) & (graus > 0)
+                if fora.any():
+                    m = int(np.argmax(np.where(fora, graus, -1)))
+                else:
+                    m = int(np.argmax(np.where(np.isfinite(cobertura), cobertura, -1)))
+                    if cobertura[m] <= 0 or not np.isfinite(cobertura[m]):
+                        if marcos:
+                            break  # todos os vértices úteis já são marcos
+                        m = inicio
+                marcos.append(m)
+                de_m, _ = _dijkstra_csr(*ida, m)
+                ate_m = _dijkstra_csr(*volta, m)[0] if csr.direcionado else de_m
+                de_marcos.append(de_m)
+                ate_marcos.append(ate_m)
+                perto = np.minimum(np.asarray(de_m, dtype=float), np.asarray(ate_m, dtype=float))
+                cobertura = perto if len(marcos) == 1 else np.minimum(cobertura, perto)
+                cobertura[marcos] = -1
+            contar("oraculo.preparacoes")
+        # uma linha por vértice: (d(m_0, v), ..., d(m_k, v)), idem até os marcos
+        tabelas = []
+        for tabela in (de_marcos, ate_marcos):
+            tabela = np.asarray(tabela, dtype=float).reshape(len(marcos), n).T
+            tabelas.append(np.where(np.isinf(tabela), _GRANDE, tabela).tolist())
+        de_marcos, ate_marcos = tabelas
+        self._estrutura = (csr, ida, marcos, de_marcos, ate_marcos)
+        return self._estrutura
+
+    @property
+    def marcos(self):
+        csr, _, marcos, _, _ = self._preparar()
+        return [csr.label(m) for m in marcos]
+
+    def _indice(self, csr, v):
+        try:
+            return csr.indice(v)
+        except KeyError:
+            raise ValueError(f"Vértice {v!r} não existe")
+
+    @staticmethod
+    def _funcao_limite(de_marcos, ate_marcos, t):
+        de_t, ate_t = de_marcos[t], ate_marcos[t]
+        memo = {}
+
+        def limite(v):
+            h = memo.get(v)
+            if h is None:
+                # max(d(m, t) - d(m, v), d(v, m) - d(t, m), 0) sobre os marcos
+                h = max([0, *map(sub, de_t, de_marcos[v]), *map(sub, ate_marcos[v], ate_t)])
+                if h >= _GRANDE / 2:
+                    h = _INF
+                memo[v] = h
+            return h
+        return limite
+
+    def limite_inferior(self, origem, destino):
+        """
+        Limite inferior ALT de d(origem, destino) (inf se provado inalcançável).
+        """
+        csr, _, _, de_marcos, ate_marcos = self._preparar()
+        s, t = self._indice(csr, origem), self._indice(csr, destino)
+        return self._funcao_limite(de_marcos, ate_marcos, t)(s)
+
+    # -------------------- consultas --------------------
+    def caminho(self, origem, destino):
+        """
+        Retorna (distância, caminho): caminho é a lista de labels de origem a
+        destino, ou (inf, []) se destino é inalcançável.
+        """
+        chave = (origem, destino)
+        resposta = self._respostas.get(chave)
+        if resposta is None and not self.grafo.direcionado:
+            reversa = self._respostas.get((destino, origem))
+            if reversa is not None:
+                resposta = (reversa[0], reversa[1][::-1])
+        if resposta is not None:
+            contar("oraculo.acertos_cache")
+            self._guardar(self._respostas, chave, resposta, self.capacidade)
+            return resposta
+
+        contar("oraculo.buscas")
+        csr, ida, _, de_marcos, ate_marcos = self._preparar()
+        s, t = self._indice(csr, origem), self._indice(csr, destino)
+        if origem in self._arvores:
+            dist, pai = self._arvores[origem]
+            d = dist[destino]
+            caminho = []
+            if d != _INF:
+                caminho = [destino]
+                while caminho[-1] != origem:
+                    caminho.append(pai[caminho[-1]])
+                caminho.reverse()
+            resposta = (d, caminho)
+        else:
+            d, pred = _a_estrela_csr(*ida, s, t, self._funcao_limite(de_marcos, ate_marcos, t))
+            caminho = []
+            if d != _INF:
+                i = t
+                while i != -1:
+                    caminho.append(csr.label(i))
+                    i = pred[i]
+                caminho.reverse()
+            resposta = (d, caminho)
+        self._guardar(self._respostas, chave, resposta, self.capacidade)
+        return resposta
+
+    def distancia(self, origem, destino):
+        return self.caminho(origem, destino)[0]
+
+    def arvore(self, origem):
+        """
+        Árvore de caminhos mínimos de origem, (dist, pai) como em dijkstra.
+        Os dicionários retornados ficam no cache: não os modifique.
+        """
+        arvore = self._arvores.get(origem)
+        if arvore is not None:
+            contar("oraculo.acertos_cache")
+            self._arvores.move_to_end(origem)
+            return arvore
+        csr, ida, _, _, _ = self._preparar()
+        s = self._indice(csr, origem)
+        dist, pred = _dijkstra_csr(*ida, s)
+        labels = csr.vertices
+        arvore = (dict(zip(labels, dist)),
+                  {v: (labels[p] if p >= 0 else None) for v, p in zip(labels, pred)})
+        self._guardar(self._arvores, origem, arvore, self.capacidade_arvores)
+        return arvore
+
+    @staticmethod
+    def _guardar(cache, chave, valor, capacidade):
+        if capacidade == 0:
+            return
+        cache[chave] = valor
+        cache.move_to_end(chave)
+        while len(cache) > capacidade:
+            cache.popitem(last=False)
+
+
+if __name__ == "__main__":
+    from .geradores import grade
+
+    G = grade(30, 30, ponderado=True, semente=0)
+    oraculo = OraculoDistancias(G, num_marcos=4)
+    print("Marcos:", oraculo.marcos)
+    print("Limite inferior:", oraculo.limite_inferior(0, 899), "distância:", oraculo.distancia(0, 899))
+    G.adicionar_aresta(0, 899, 1)
+    print("Após adicionar (0, 899, 1):", oraculo.caminho(0, 899))
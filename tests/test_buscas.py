@@ -0,0 +1,66 @@
+import pytest
+
+from grafos.bfs import bfs, bfs_multiplas_fontes
+from grafos.dfs import dfs
+from grafos.geradores import erdos_renyi
+from grafos.grafo_utils import Grafo
+
+INF = float("inf")
+
+
+@pytest.fixture
+def grafo_exemplo():
+    return Grafo(vertices=[1, 2, 3, 4, 5, 6, 7],
+                 arestas=[(1, 2), (1, 3), (1, 4), (2, 4), (2, 6), (6, 5), (6, 7), (5, 7), (7, 4), (4, 3)],
+                 direcionado=False)
+
+
+# -------------------- bfs --------------------
+def test_bfs_distancias_e_pais(grafo_exemplo):
+    d, pi = bfs(grafo_exemplo, 2)
+    assert d == {1: 1, 2: 0, 3: 2, 4: 1, 5: 2, 6: 1, 7: 2}
+    assert pi == {1: 2, 2: None, 3: 1, 4: 2, 5: 6, 6: 2, 7: 4}
+
+
+def test_bfs_inalcancavel():
+    G = Grafo(vertices=["a", "b", "c"], arestas=[("a", "b")], direcionado=True)
+    d, pi = bfs(G, "b")
+    assert d == {"a": INF, "b": 0, "c": INF}
+    assert pi == {"a": None, "b": None, "c": None}
+
+
+def test_bfs_multiplas_fontes_concorda_com_bfs():
+    G = erdos_renyi(60, grau_medio=3, direcionado=True, semente=1)
+    fontes = [0, 7, 31]
+    matriz = bfs_multiplas_fontes(G, fontes)
+    vertices = G.csr().vertices
+    for linha, s in zip(matriz.tolist(), fontes):
+        d, _ = bfs(G, s)
+        assert linha == [d[v] if d[v] != INF else -1 for v in vertices]
+
+
+# -------------------- dfs --------------------
+def test_dfs_tempos_e_ciclos(grafo_exemplo):
+    d, f, pi, ciclos = dfs(grafo_exemplo, 2)
+    assert d == {2: 1, 1: 2, 3: 3, 4: 4, 7: 5, 5: 6, 6: 7}
+    assert f == {6: 8, 5: 9, 7: 10, 4: 11, 3: 12, 1: 13, 2: 14}
+    assert pi == {1: 2, 2: None, 3: 1, 4: 3, 5: 7, 6: 5, 7: 4}
+    # conexo com 7 vértices e 10 arestas: exatamente 10 - 6 arestas de retorno
+    assert ciclos == [(4, 1), (4, 2), (6, 2), (6, 7)]
+    assert grafo_exemplo.vertices == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_dfs_aresta_do_pai_nao_e_ciclo():
+    G = Grafo(vertices=[0, 1, 2], arestas=[(0, 1), (1, 2)], direcionado=False)
+    assert dfs(G)[3] == []
+    # em grafo direcionado, u -> v -> u é um ciclo de verdade
+    G = Grafo(vertices=[0, 1], arestas=[(0, 1), (1, 0)], direcionado=True)
+    assert dfs(G)[3] == [(1, 0)]
+
+
+def test_dfs_comeca_no_vertice_zero():
+    G = Grafo(vertices=[2, 1, 0], arestas=[(0, 1), (1, 2)], direcionado=False)
+    d, f, pi, _ = dfs(G, 0)
+    assert d == {0: 1, 1: 2, 2: 3}
+    assert pi == {0: None, 1: 0, 2: 1}
+    assert G.vertices == [2, 1, 0]
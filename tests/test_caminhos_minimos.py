@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from grafos.bellman_ford import bellman_ford, bellman_ford_vetorizado, spfa
+from grafos.dijkstra import dijkstra
+from grafos.floyd_warshall import floyd_warshall, floyd_warshall_matricial
+from grafos.geradores import erdos_renyi
+from grafos.grafo_utils import Grafo
+from grafos.johnson import johnson
+
+
+def _com_negativos(G, semente):
+    """
+    Mesmo grafo com w(u, v) + h(u) - h(v) para h aleatório: surgem pesos
+    negativos, mas todo ciclo mantém o peso (não há ciclo negativo).
+    """
+    h = np.random.default_rng(semente).integers(0, 15, size=len(G.vertices)).tolist()
+    arestas = [(u, v, w + h[u] - h[v]) for (u, v), w in G.arestas.items()]
+    return Grafo(list(G.vertices), arestas, direcionado=True, ponderado=True)
+
+
+def _matriz_por_origem(G, algoritmo):
+    vertices = G.csr().vertices
+    return np.array([[algoritmo(G, s)[0][v] for v in vertices] for s in vertices], dtype=float)
+
+
+@pytest.mark.parametrize("semente", range(3))
+@pytest.mark.parametrize("direcionado", [True, False])
+def test_todos_concordam_sem_pesos_negativos(semente, direcionado):
+    G = erdos_renyi(40, grau_medio=3, direcionado=direcionado, ponderado=True, semente=semente)
+    vertices = G.csr().vertices
+    D_fw, _ = floyd_warshall_matricial(G)
+    D_j, _ = johnson(G)
+    np.testing.assert_array_equal(D_j, D_fw)
+    for algoritmo in (dijkstra, bellman_ford, spfa, bellman_ford_vetorizado):
+        np.testing.assert_array_equal(_matriz_por_origem(G, algoritmo), D_fw)
+    A, _ = floyd_warshall(G)
+    assert A == {(v, w): D_fw[i, j] for i, v in enumerate(vertices) for j, w in enumerate(vertices)}
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_concordam_com_pesos_negativos(semente):
+    G = _com_negativos(erdos_renyi(40, grau_medio=3, direcionado=True, ponderado=True, semente=semente),
+                       semente)
+    assert any(w < 0 for w in G.arestas.values())
+    D_fw, _ = floyd_warshall_matricial(G)
+    np.testing.assert_array_equal(johnson(G)[0], D_fw)
+    for algoritmo in (bellman_ford, spfa, bellman_ford_vetorizado):
+        np.testing.assert_array_equal(_matriz_por_origem(G, algoritmo), D_fw)
+
+
+def test_predecessores_do_floyd_warshall_por_par():
+    G = erdos_renyi(30, grau_medio=3, direcionado=True, ponderado=True, semente=4)
+    A, pi = floyd_warshall(G)
+    assert pi.keys() == A.keys()
+    for (v, w), p in pi.items():
+        if v == w or A[(v, w)] == float("inf"):
+            assert p is None
+        else:
+            # pi[(v, w)] é o penúltimo vértice de um caminho mínimo de v a w
+            assert A[(v, p)] + G.arestas[(p, w)] == A[(v, w)]
+
+
+def test_ciclo_negativo():
+    G = Grafo([1, 2, 3], [(1, 2, 1), (2, 3, -2), (3, 1, 0)], direcionado=True, ponderado=True)
+    for algoritmo in (floyd_warshall, johnson):
+        with pytest.raises(ValueError):
+            algoritmo(G)
+    for algoritmo in (bellman_ford, spfa, bellman_ford_vetorizado):
+        with pytest.raises(ValueError):
+            algoritmo(G, 1)
@@ -0,0 +1,37 @@
+import pytest
+
+from grafos.alg_fleury import alg_fleury
+from grafos.grafo_utils import Grafo
+
+# saídas da implementação original (matriz de adjacências + deepcopy)
+CASOS = [
+    ([1, 2, 3, 4, 5, 6, 7, 8, 9],
+     [(1, 2), (1, 5), (2, 3), (2, 5), (2, 4), (3, 6), (4, 5), (4, 8), (4, 7),
+      (5, 6), (5, 9), (5, 8), (7, 8), (8, 9)],
+     [(1, 2), (2, 3), (3, 6), (6, 5), (5, 2), (2, 4), (4, 5), (5, 8), (8, 4),
+      (4, 7), (7, 8), (8, 9), (9, 5), (5, 1)]),
+    (["a", "b", "c", "d", "e"],
+     [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("d", "e"), ("e", "c")],
+     [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e"), ("e", "c"), ("c", "a")]),
+    ([0, 1, 2, 3],
+     [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)],
+     [(0, 1), (1, 2), (2, 0), (0, 3), (3, 2)]),
+]
+
+
+@pytest.mark.parametrize("vertices, arestas, esperado", CASOS)
+def test_mesma_saida_da_versao_original(vertices, arestas, esperado):
+    G = Grafo(vertices=vertices, arestas=arestas, direcionado=False)
+    assert alg_fleury(G) == esperado
+
+
+@pytest.mark.parametrize("vertices, arestas, esperado", CASOS)
+def test_sem_espelhar(vertices, arestas, esperado):
+    G = Grafo(vertices=vertices, arestas=arestas, direcionado=False, espelhar=False)
+    assert alg_fleury(G) == esperado
+
+
+def test_grafo_direcionado_rejeitado():
+    G = Grafo(vertices=[1, 2, 3], arestas=[(1, 2), (2, 3), (3, 1)], direcionado=True)
+    with pytest.raises(ValueError):
+        alg_fleury(G)
@@ -0,0 +1,110 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from grafos.grafo_utils import Grafo
+
+VERTICES = [0, 1, 2, 3, 4, 5]
+INICIAIS = [(0, 1, 4), (1, 2, 1), (2, 0, 7), (3, 4, 2)]
+# novas arestas e a troca de peso de uma já existente (no sentido inverso)
+NOVAS = [(4, 5, 3), (2, 5, 1), (1, 0, 9), (0, 3, 6)]
+
+CONFIGURACOES = [
+    dict(direcionado=True, ponderado=False),
+    dict(direcionado=True, ponderado=True),
+    dict(direcionado=False, ponderado=False),
+    dict(direcionado=False, ponderado=True),
+    dict(direcionado=False, ponderado=False, espelhar=False),
+    dict(direcionado=False, ponderado=True, espelhar=False),
+]
+
+
+def _arestas(triplas, ponderado):
+    return list(triplas) if ponderado else [(u, v) for u, v, _ in triplas]
+
+
+def _estado(G):
+    """
+    Tudo que os caches do Grafo servem, num formato comparável entre grafos
+    construídos de formas diferentes (e com espelhar diferente).
+    """
+    csr = G.csr()
+    return {
+        "adj": {v: sorted(adj) for v, adj in G.lista_adjacencias().items()},
+        "adj_ponderada": {v: sorted(adj) for v, adj in G.lista_adjacencias(ponderada=True).items()},
+        "adj_ordenada": G.lista_adjacencias(ordenada=True),
+        "adj_ponderada_ordenada": G.lista_adjacencias(ponderada=True, ordenada=True),
+        "grau_entrada": G.grau_entrada_dos_vertices(),
+        "grau_saida": G.grau_saida_dos_vertices(),
+        "csr": csr.lista_adjacencias(ponderada=True, ordenada=True),
+        "matriz": np.asarray(G.matriz_de_adjacencias(ponderada=True)).tolist(),
+        "arestas": {p for p in itertools.product(G.vertices, repeat=2) if G.verificar_aresta(p)},
+        "vertices": [v for v in G.vertices if G.verificar_vertice(v)],
+    }
+
+
+def _esperado(configuracao, vertices, triplas):
+    """
+    Grafo recém-construído (sem caches) com o resultado final das inserções;
+    nas repetidas vale o último peso, como em adicionar_aresta.
+    """
+    finais = {}
+    for u, v, w in triplas:
+        if not configuracao["direcionado"]:
+            finais.pop((v, u), None)
+        finais[(u, v)] = w
+    triplas = [(u, v, w) for (u, v), w in finais.items()]
+    parametros = dict(configuracao, espelhar=True)
+    return _estado(Grafo(list(vertices), _arestas(triplas, configuracao["ponderado"]), **parametros))
+
+
+@pytest.mark.parametrize("configuracao", CONFIGURACOES)
+def test_adicionar_aresta_mantem_caches(configuracao):
+    ponderado = configuracao["ponderado"]
+    G = Grafo(list(VERTICES), _arestas(INICIAIS, ponderado), **configuracao)
+    assert _estado(G) == _esperado(configuracao, VERTICES, INICIAIS)
+    for u, v, w in NOVAS:
+        G.adicionar_aresta(u, v, w if ponderado else None)
+    assert _estado(G) == _esperado(configuracao, VERTICES, INICIAIS + NOVAS)
+
+
+@pytest.mark.parametrize("configuracao", CONFIGURACOES)
+def test_adicionar_arestas_mantem_caches(configuracao):
+    ponderado = configuracao["ponderado"]
+    G = Grafo(list(VERTICES), _arestas(INICIAIS, ponderado), **configuracao)
+    _estado(G)
+    G.adicionar_arestas(_arestas(NOVAS, ponderado))
+    assert _estado(G) == _esperado(configuracao, VERTICES, INICIAIS + NOVAS)
+    # em lote, como array NumPy (m, 3)/(m, 2), repetindo arestas já presentes
+    lote = np.array(_arestas(NOVAS[:2] + [(2, 3, 5)], ponderado))
+    G.adicionar_arestas(lote)
+    assert _estado(G) == _esperado(configuracao, VERTICES, INICIAIS + NOVAS + [(2, 3, 5)])
+
+
+@pytest.mark.parametrize("configuracao", CONFIGURACOES)
+def test_adicionar_vertice_mantem_caches(configuracao):
+    ponderado = configuracao["ponderado"]
+    G = Grafo(list(VERTICES), _arestas(INICIAIS, ponderado), **configuracao)
+    _estado(G)
+    G.adicionar_vertice(6)
+    G.adicionar_aresta(6, 0, 2 if ponderado else None)
+    assert _estado(G) == _esperado(configuracao, VERTICES + [6], INICIAIS + [(6, 0, 2)])
+
+
+def test_sem_espelhar_guarda_cada_aresta_uma_vez():
+    G = Grafo(list(VERTICES), _arestas(INICIAIS, False), direcionado=False, espelhar=False)
+    G.adicionar_aresta(1, 0)
+    G.adicionar_arestas([(2, 1), (4, 5)])
+    assert len(G.arestas) == len(INICIAIS) + 1
+
+
+def test_invalidar_caches_reconstroi_indices():
+    G = Grafo(list(VERTICES), _arestas(INICIAIS, False), direcionado=True)
+    _estado(G)
+    # mudanças manuais nas listas públicas seguidas de _invalidar_caches
+    G.vertices.append(6)
+    G.arestas.append((6, 0))
+    G._invalidar_caches()
+    assert _estado(G) == _esperado(dict(direcionado=True, ponderado=False), VERTICES + [6],
+                                   INICIAIS + [(6, 0, 1)])
@@ -0,0 +1,61 @@
+import gc
+import weakref
+
+from grafos.apsp_dinamico import APSPDinamico
+from grafos.grafo_utils import Grafo
+from grafos.oraculo import OraculoDistancias
+
+
+def _caminho():
+    return Grafo([0, 1, 2], [(0, 1, 1), (1, 2, 1)], direcionado=False, ponderado=True)
+
+
+def test_observador_forte_e_remocao():
+    G = _caminho()
+    eventos = []
+    observador = lambda *args: eventos.append(args)  # noqa: E731
+    G.registrar_observador(observador)
+    G.registrar_observador(observador)
+    G.adicionar_vertice(3)
+    G.remover_observador(observador)
+    G.adicionar_vertice(4)
+    assert eventos == [("vertice", 3, None, None, None)]
+
+
+def test_oraculo_acompanha_o_grafo():
+    G = _caminho()
+    oraculo = OraculoDistancias(G, num_marcos=2)
+    assert oraculo.distancia(0, 2) == 2
+    G.adicionar_aresta(0, 2, 1)
+    assert oraculo.distancia(0, 2) == 1
+
+
+def test_oraculo_descartado_e_coletado():
+    G = _caminho()
+    oraculo = OraculoDistancias(G)
+    oraculo.distancia(0, 2)
+    referencia = weakref.ref(oraculo)
+    del oraculo
+    gc.collect()
+    assert referencia() is None
+    G.adicionar_aresta(0, 2, 5)  # o observador morto sai da lista
+    assert G._observadores == []
+
+
+def test_apsp_dinamico_acompanha_o_grafo():
+    G = _caminho()
+    apsp = APSPDinamico(G)
+    G.adicionar_aresta(0, 2, 1)
+    assert apsp.distancia(0, 2) == 1 and apsp.caminho(0, 2) == [0, 2]
+    apsp.fechar()
+    G.adicionar_aresta(0, 2, 7)
+    assert apsp.distancia(0, 2) == 1
+
+
+def test_apsp_dinamico_descartado_e_coletado():
+    G = _caminho()
+    referencia = weakref.ref(APSPDinamico(G))
+    gc.collect()
+    assert referencia() is None
+    G.adicionar_vertice(3)
+    assert G._observadores == []